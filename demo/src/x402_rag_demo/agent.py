@@ -1,20 +1,19 @@
 from __future__ import annotations
 
 import os
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 from langchain.agents import create_agent
-from langchain_core.language_models import BaseChatModel
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_openai import ChatOpenAI
-from langgraph.graph.state import CompiledStateGraph
 from x402_rag_langchain import make_x402_rag_tools
-from x402_rag_sdk import ClientConfig, X402RagClient
+from x402_rag_sdk import X402RagClient
+
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+    from langgraph.graph.state import CompiledStateGraph
 
 
 def create_rag_agent(
-    base_url: str,
-    x402_keypair_hex: str,
+    client: X402RagClient,
     api_key: str,
     provider: Literal["openai", "google"] = "google",
     model_name: str | None = None,
@@ -24,8 +23,8 @@ def create_rag_agent(
     Create a LangChain agent with X402 RAG tools and your choice of LLM provider.
 
     Args:
-        base_url: X402 RAG server URL
-        x402_keypair_hex: Solana keypair for x402 payments
+        client: X402RagClient shared by the agent's tools, reused across turns. Use
+            `X402RagClient.get_or_create(config)` to share one client between several agents.
         api_key: API key for the LLM provider (OpenAI or Google)
         provider: LLM provider - "openai" or "google"
         model_name: Model name (defaults: gpt-4o-mini for openai, gemini-2.0-flash for google)
@@ -34,16 +33,13 @@ def create_rag_agent(
     Returns:
         Compiled LangGraph agent ready to use
     """
-    config = ClientConfig(
-        base_url=base_url,
-        x402_keypair_hex=x402_keypair_hex,
-    )
-    client = X402RagClient(config)
     tools = make_x402_rag_tools(client)
 
-    # Create LLM based on provider
+    # Create LLM based on provider. Provider packages are imported here so only the one in use is loaded.
     llm: BaseChatModel
     if provider == "openai":
+        from langchain_openai import ChatOpenAI
+
         llm = ChatOpenAI(
             model=model_name or "gpt-4o-mini",
             api_key=api_key,
@@ -51,6 +47,8 @@ def create_rag_agent(
             base_url=os.getenv("OPENAI_BASE_URL") or "https://api.openai.com/v1",
         )
     elif provider == "google":
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
         llm = ChatGoogleGenerativeAI(
             model=model_name or "gemini-2.0-flash",
             google_api_key=api_key,
@@ -61,13 +59,15 @@ def create_rag_agent(
 
     system_prompt = """You are a helpful AI assistant with access to a RAG (Retrieval-Augmented Generation) system.
 
-You have two tools available:
+You have three tools available:
 1. search - Search the knowledge base for relevant information
 2. get_chunks - Retrieve specific chunks from a document
+3. batch - Run several search/get_chunks calls at once
 
 When a user asks a question:
 - Use search to find relevant information
 - If you need more context from a specific document, use get_chunks
+- If you need several searches or chunk ranges, run them together with batch
 - Always cite the source metadata when providing information
 - Be concise but informative in your responses
 
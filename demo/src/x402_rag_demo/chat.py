@@ -5,13 +5,20 @@ from __future__ import annotations
 import asyncio
 import os
 import sys
+from collections.abc import Callable
 from pathlib import Path
 
 from dotenv import load_dotenv
 from langchain_core.messages import AIMessage, HumanMessage
+from x402_rag_sdk import ClientConfig, X402RagClient, X402RagError
 
 from .agent import create_rag_agent
 
+try:
+    import uvloop
+except ImportError:  # optional, installed with the `fast` extra
+    uvloop = None
+
 
 def load_env() -> dict[str, str]:
     """Load environment variables from .env file."""
@@ -59,6 +66,55 @@ def load_env() -> dict[str, str]:
     }
 
 
+# Below the SDK's default keep-alive expiry (30s), so idle connections stay open while the user types
+KEEP_ALIVE_INTERVAL_SECONDS = 20.0
+
+
+async def ainput(prompt: str) -> str:
+    """`input()` without blocking the event loop while the user types.
+
+    A terminal is watched with `loop.add_reader` instead of being read in an executor thread: on
+    Ctrl-C the loop shuts its executor down and would wait forever for a thread stuck in `input()`.
+    Redirected stdin (a file or pipe) and loops without `add_reader` use a plain `input()`.
+    """
+    fd = sys.stdin.fileno()
+    if not os.isatty(fd):
+        return input(prompt)
+
+    loop = asyncio.get_running_loop()
+    readable: asyncio.Future[None] = loop.create_future()
+
+    def on_readable() -> None:
+        if not readable.done():
+            readable.set_result(None)
+
+    try:
+        loop.add_reader(fd, on_readable)
+    except (NotImplementedError, OSError):
+        return input(prompt)
+
+    print(prompt, end="", flush=True)
+    try:
+        await readable
+    finally:
+        loop.remove_reader(fd)
+    # A terminal only turns readable once a whole line was entered, so this doesn't block
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.removesuffix("\n")
+
+
+async def keep_alive(client: X402RagClient) -> None:
+    """Periodically ping the server so pooled connections survive user think-time."""
+    while True:
+        await asyncio.sleep(KEEP_ALIVE_INTERVAL_SECONDS)
+        try:
+            await client.health()
+        except X402RagError:
+            pass
+
+
 async def chat_loop() -> None:
     """Run the interactive chat loop."""
     env = load_env()
@@ -72,52 +128,68 @@ async def chat_loop() -> None:
     print("=" * 60)
     print()
 
-    agent = create_rag_agent(
+    config = ClientConfig(
         base_url=env["base_url"],
         x402_keypair_hex=env["x402_keypair_hex"],
-        api_key=env["api_key"],
-        provider=env["provider"],
-        model_name=env["model_name"],
     )
 
-    chat_history: list[HumanMessage | AIMessage] = []
+    # Keep a single client (and its connection pool) open for the whole session
+    async with X402RagClient.get_or_create(config) as client:
+        agent = create_rag_agent(
+            client=client,
+            api_key=env["api_key"],
+            provider=env["provider"],
+            model_name=env["model_name"],
+        )
 
-    while True:
-        try:
-            user_input = input("You: ").strip()
+        chat_history: list[HumanMessage | AIMessage] = []
+        keep_alive_task = asyncio.create_task(keep_alive(client))
 
-            if not user_input:
-                continue
+        while True:
+            try:
+                # Read input off the event loop, so the keep-alive pings run while the user types
+                user_input = (await ainput("You: ")).strip()
 
-            if user_input.lower() in ("exit", "quit", "q"):
-                print("\nGoodbye!")
-                break
+                if not user_input:
+                    continue
 
-            print()
+                if user_input.lower() in ("exit", "quit", "q"):
+                    print("\nGoodbye!")
+                    break
 
-            chat_history.append(HumanMessage(content=user_input))
+                print()
 
-            result = await agent.ainvoke({"messages": chat_history})
+                chat_history.append(HumanMessage(content=user_input))
 
-            response = result["messages"][-1].content
+                result = await agent.ainvoke({"messages": chat_history})
+
+                response = result["messages"][-1].content
+
+                print(f"\nAssistant: {response}\n")
+                print("-" * 60)
+                print()
+
+                chat_history = result["messages"]
+
+            except (KeyboardInterrupt, EOFError):
+                print("\n\nGoodbye!")
+                break
+            except Exception as e:
+                print(f"\nError: {e}\n", file=sys.stderr)
 
-            print(f"\nAssistant: {response}\n")
-            print("-" * 60)
-            print()
+        keep_alive_task.cancel()
 
-            chat_history = result["messages"]
 
-        except KeyboardInterrupt:
-            print("\n\nGoodbye!")
-            break
-        except Exception as e:
-            print(f"\nError: {e}\n", file=sys.stderr)
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's loop factory when uvloop is installed, else None for the default loop."""
+    return uvloop.new_event_loop if uvloop is not None else None
 
 
 def main() -> None:
     """Entry point for the chat CLI."""
     try:
-        asyncio.run(chat_loop())
+        with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+            runner.run(chat_loop())
     except KeyboardInterrupt:
         print("\n\nGoodbye!")
 
@@ -20,6 +20,8 @@ Example:
 from x402_rag_sdk import ClientConfig, X402RagClient
 
 from .tools import (
+    X402RagBatchArgs,
+    X402RagBatchTool,
     X402RagGetChunksArgs,
     X402RagGetChunksTool,
     X402RagSearchArgs,
@@ -34,7 +36,9 @@ __all__ = [
     # Tools & args
     "X402RagSearchArgs",
     "X402RagGetChunksArgs",
+    "X402RagBatchArgs",
     "X402RagSearchTool",
     "X402RagGetChunksTool",
+    "X402RagBatchTool",
     "make_x402_rag_tools",
 ]
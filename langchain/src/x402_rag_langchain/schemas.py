@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any, Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -8,7 +10,9 @@ class X402RagSearchArgs(BaseModel):
 
     query: str = Field(..., description="Search query text")
     k: int = Field(5, ge=1, description="Number of results to return (default: 5)")
-    filters: dict[str, str] | None = Field(default=None, description="Optional metadata filters to apply")
+    filters: dict[str, str] | None = Field(
+        default=None, description="Optional metadata filters to apply"
+    )
 
 
 class X402RagGetChunksArgs(BaseModel):
@@ -16,4 +20,25 @@ class X402RagGetChunksArgs(BaseModel):
 
     doc_id: str = Field(..., description="Document ID to fetch from")
     start_chunk: int = Field(..., ge=0, description="Starting chunk index (inclusive)")
-    end_chunk: int | None = Field(default=None, ge=0, description="Ending chunk index (inclusive, optional)")
+    end_chunk: int | None = Field(
+        default=None, ge=0, description="Ending chunk index (inclusive, optional)"
+    )
+
+
+class X402RagBatchInvocation(BaseModel):
+    """A single tool invocation inside a batch."""
+
+    tool_name: Literal["search", "get_chunks"] = Field(
+        ..., description="Tool to invoke: 'search' or 'get_chunks'"
+    )
+    arguments: dict[str, Any] = Field(
+        default_factory=dict, description="Arguments for the invoked tool"
+    )
+
+
+class X402RagBatchArgs(BaseModel):
+    """Arguments for running several tool invocations concurrently."""
+
+    invocations: list[X402RagBatchInvocation] = Field(
+        ..., min_length=1, description="Tool invocations to run"
+    )
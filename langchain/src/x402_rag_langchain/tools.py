@@ -1,12 +1,69 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from langchain_core.tools import BaseTool
-from pydantic import BaseModel
-from x402_rag_sdk import X402RagClient
+from pydantic import BaseModel, TypeAdapter
+from x402_rag_sdk import (
+    DocumentChunk,
+    DocumentChunkMetadata,
+    FetchChunksByRangeResult,
+    SearchResult,
+    X402RagClient,
+)
 
-from .schemas import X402RagGetChunksArgs, X402RagSearchArgs
+from .schemas import (
+    X402RagBatchArgs,
+    X402RagBatchInvocation,
+    X402RagGetChunksArgs,
+    X402RagSearchArgs,
+)
+
+# Dumps all chunk metadata in one pydantic-core call, not a `model_dump` per chunk
+_METADATA_LIST_ADAPTER = TypeAdapter(list[DocumentChunkMetadata])
+
+
+def _dump_chunks(chunks: list[DocumentChunk]) -> list[dict[str, Any]]:
+    metadatas = _METADATA_LIST_ADAPTER.dump_python([c.metadata for c in chunks])
+    return [
+        {"text": c.text, "metadata": m} for c, m in zip(chunks, metadatas, strict=True)
+    ]
+
+
+def _search_response(result: SearchResult) -> dict[str, Any]:
+    response = {
+        "ok": True,
+        "total": result.total,
+        "chunks": _dump_chunks(result.chunks),
+    }
+
+    # Include payment info if payment was made
+    if result.payment:
+        response["payment"] = {
+            "paid_amount_usdc_base_units": result.payment.paid_amount,
+            "pay_to_address": result.payment.pay_to,
+        }
+
+    return response
+
+
+def _get_chunks_response(result: FetchChunksByRangeResult) -> dict[str, Any]:
+    response = {
+        "ok": True,
+        "doc_id": result.doc_id,
+        "total": result.total,
+        "chunks": _dump_chunks(result.chunks),
+    }
+
+    # Include payment info if payment was made
+    if result.payment:
+        response["payment"] = {
+            "paid_amount_usdc_base_units": result.payment.paid_amount,
+            "pay_to_address": result.payment.pay_to,
+        }
+
+    return response
 
 
 class _X402RagBaseTool(BaseTool):
@@ -16,7 +73,10 @@ class _X402RagBaseTool(BaseTool):
 
     # Prevent accidental sync use; LangChain agents should call `ainvoke`/`_arun`.
     def _run(self, *args: Any, **kwargs: Any) -> Any:  # type: ignore[override]
-        raise NotImplementedError("X402Rag tools are async-only. Use `ainvoke`/`_arun` with an async agent or loop.")
+        raise NotImplementedError(
+            "X402Rag tools are async-only. "
+            "Use `ainvoke`/`_arun` with an async agent or loop."
+        )
 
 
 class X402RagSearchTool(_X402RagBaseTool):
@@ -41,26 +101,7 @@ class X402RagSearchTool(_X402RagBaseTool):
         except Exception as e:
             return {"ok": False, "error": str(e)}
 
-        response = {
-            "ok": True,
-            "total": result.total,
-            "chunks": [
-                {
-                    "text": c.text,
-                    "metadata": c.metadata.model_dump(),
-                }
-                for c in result.chunks
-            ],
-        }
-
-        # Include payment info if payment was made
-        if result.payment:
-            response["payment"] = {
-                "paid_amount_usdc_base_units": result.payment.paid_amount,
-                "pay_to_address": result.payment.pay_to,
-            }
-
-        return response
+        return _search_response(result)
 
 
 class X402RagGetChunksTool(_X402RagBaseTool):
@@ -89,27 +130,53 @@ class X402RagGetChunksTool(_X402RagBaseTool):
         except Exception as e:
             return {"ok": False, "error": str(e)}
 
-        response = {
-            "ok": True,
-            "doc_id": result.doc_id,
-            "total": result.total,
-            "chunks": [
-                {
-                    "text": c.text,
-                    "metadata": c.metadata.model_dump(),
-                }
-                for c in result.chunks
-            ],
-        }
+        return _get_chunks_response(result)
+
 
-        # Include payment info if payment was made
-        if result.payment:
-            response["payment"] = {
-                "paid_amount_usdc_base_units": result.payment.paid_amount,
-                "pay_to_address": result.payment.pay_to,
-            }
+class X402RagBatchTool(_X402RagBaseTool):
+    """LangChain tool: Run several search/get_chunks invocations concurrently."""
 
-        return response
+    name: str = "batch"
+    description: str = (
+        "Run several search and get_chunks calls at once, concurrently.\n"
+        "Inputs: { invocations: "
+        "[{ tool_name: 'search' | 'get_chunks', arguments: {...} }] }\n"
+        "Arguments are the same as for the corresponding tool.\n"
+        "Returns a JSON object with a list of results, one per invocation, "
+        "in the same order."
+    )
+    args_schema: type[BaseModel] = X402RagBatchArgs  # type: ignore[assignment]
+
+    async def _invoke(
+        self, invocation: X402RagBatchInvocation | dict[str, Any]
+    ) -> dict[str, Any]:
+        try:
+            invocation = X402RagBatchInvocation.model_validate(invocation)
+            if invocation.tool_name == "search":
+                args = X402RagSearchArgs.model_validate(invocation.arguments)
+                result = await self.client.search(
+                    query=args.query, k=args.k, filters=args.filters
+                )
+                return _search_response(result)
+
+            args = X402RagGetChunksArgs.model_validate(invocation.arguments)
+            result = await self.client.get_chunk_range(
+                doc_id=args.doc_id,
+                start_chunk=args.start_chunk,
+                end_chunk=args.end_chunk,
+            )
+            return _get_chunks_response(result)
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    async def _arun(
+        self,
+        invocations: list[X402RagBatchInvocation] | list[dict[str, Any]],
+    ) -> dict[str, Any]:  # type: ignore[override]
+        results = await asyncio.gather(
+            *[self._invoke(invocation) for invocation in invocations]
+        )
+        return {"ok": True, "results": list(results)}
 
 
 def make_x402_rag_tools(
@@ -119,18 +186,25 @@ def make_x402_rag_tools(
     context_description: str = "",
     search_description: str | None = None,
     get_chunks_description: str | None = None,
+    batch_description: str | None = None,
 ) -> list[BaseTool]:
-    """Create both LangChain tools with a pre-initialized X402RagClient.
+    """Create the LangChain tools with a pre-initialized X402RagClient.
 
     Args:
         client: X402RagClient instance to use for the tools.
-        prefix: Optional prefix to add to tool names (e.g., 'company_docs' -> 'company_docs_search').
-        context_description: Optional context description prepended to all tool descriptions
-            to help agents distinguish between multiple tool sets.
+        prefix: Optional prefix to add to tool names
+            (e.g., 'company_docs' -> 'company_docs_search').
+        context_description: Optional context description prepended to all tool
+            descriptions to help agents distinguish between multiple tool sets.
         search_description: Optional custom description for the search tool.
-            If not provided, uses default description with context_description prepended.
+            If not provided, uses the default description with
+            context_description prepended.
         get_chunks_description: Optional custom description for the get_chunks tool.
-            If not provided, uses default description with context_description prepended.
+            If not provided, uses the default description with
+            context_description prepended.
+        batch_description: Optional custom description for the batch tool.
+            If not provided, uses the default description with
+            context_description prepended.
 
     Returns:
         List of configured LangChain tools.
@@ -139,29 +213,44 @@ def make_x402_rag_tools(
         >>> tools = make_x402_rag_tools(
         ...     client=client,
         ...     prefix="company_docs",
-        ...     context_description="Search through internal company documentation and policies.",
+        ...     context_description="Search through internal company documentation.",
         ... )
-        >>> # Creates tools: 'company_docs_search' and 'company_docs_get_chunks'
+        >>> # Creates tools: 'company_docs_search', 'company_docs_get_chunks'
+        >>> # and 'company_docs_batch'
     """
     search_tool = X402RagSearchTool(client=client)
     get_chunks_tool = X402RagGetChunksTool(client=client)
+    batch_tool = X402RagBatchTool(client=client)
 
     # Apply prefix to tool names
     if prefix:
         search_tool.name = f"{prefix}_search"
         get_chunks_tool.name = f"{prefix}_get_chunks"
+        batch_tool.name = f"{prefix}_batch"
 
     # Apply context and custom descriptions
     if context_description or search_description:
         if search_description:
             search_tool.description = search_description
         elif context_description:
-            search_tool.description = f"{context_description}\n\n{search_tool.description}"
+            search_tool.description = (
+                f"{context_description}\n\n{search_tool.description}"
+            )
 
     if context_description or get_chunks_description:
         if get_chunks_description:
             get_chunks_tool.description = get_chunks_description
         elif context_description:
-            get_chunks_tool.description = f"{context_description}\n\n{get_chunks_tool.description}"
+            get_chunks_tool.description = (
+                f"{context_description}\n\n{get_chunks_tool.description}"
+            )
+
+    if context_description or batch_description:
+        if batch_description:
+            batch_tool.description = batch_description
+        elif context_description:
+            batch_tool.description = (
+                f"{context_description}\n\n{batch_tool.description}"
+            )
 
-    return [search_tool, get_chunks_tool]
+    return [search_tool, get_chunks_tool, batch_tool]
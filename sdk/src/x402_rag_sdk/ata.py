@@ -1,4 +1,8 @@
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+
 from solana.rpc.async_api import AsyncClient
+from solders.hash import Hash
 from solders.keypair import Keypair
 from solders.message import MessageV0
 from solders.pubkey import Pubkey
@@ -6,49 +10,61 @@ from solders.transaction import VersionedTransaction
 from spl.token.instructions import create_idempotent_associated_token_account, get_associated_token_address
 
 
+@lru_cache(maxsize=256)
+def associated_token_address(owner_pubkey: Pubkey, mint_pubkey: Pubkey) -> Pubkey:
+    """Memoized `get_associated_token_address`; the same owner/mint pairs recur on every payment."""
+    return get_associated_token_address(owner_pubkey, mint_pubkey)
+
+
 async def ensure_ata_exists(
     *,
-    rpc_url: str,
+    rpc: AsyncClient,
     payer_keypair: Keypair,
     owner_pubkey: Pubkey,
     mint_pubkey: Pubkey,
-) -> Pubkey:
+    get_blockhash: Callable[[], Awaitable[Hash]] | None = None,
+) -> tuple[Pubkey, bool]:
     """
     Ensures the owner's ATA for `mint_pubkey` exists.
     If missing, creates it in a separate tx where the owner is the payer.
-    Returns the ATA address.
+    `get_blockhash` supplies the blockhash for that tx (e.g. a payer's cached one);
+    it is fetched from `rpc` if not given.
+    Returns the ATA address, and whether it was found on-chain (False when a create tx was
+    just sent, which may still be dropped).
     """
     payer = payer_keypair.pubkey()
-    ata = get_associated_token_address(owner_pubkey, mint_pubkey)
-
-    async with AsyncClient(rpc_url) as rpc:
-        # 1) Check if ATA already exists
-        info = await rpc.get_account_info(ata)
-        if info.value is not None:
-            return ata
-
-        # 2) Build idempotent ATA create (payer = owner)
-        ix = create_idempotent_associated_token_account(
-            payer=payer,
-            owner=owner_pubkey,
-            mint=mint_pubkey,
-        )
-
-        # 3) Recent blockhash
+    ata = associated_token_address(owner_pubkey, mint_pubkey)
+
+    # 1) Check if ATA already exists
+    info = await rpc.get_account_info(ata)
+    if info.value is not None:
+        return ata, True
+
+    # 2) Build idempotent ATA create (payer = owner)
+    ix = create_idempotent_associated_token_account(
+        payer=payer,
+        owner=owner_pubkey,
+        mint=mint_pubkey,
+    )
+
+    # 3) Recent blockhash
+    if get_blockhash is None:
         recent_blockhash = (await rpc.get_latest_blockhash()).value.blockhash
+    else:
+        recent_blockhash = await get_blockhash()
+
+    # 4) Message + tx: payer is the owner (not the facilitator)
+    msg = MessageV0.try_compile(
+        payer=payer,
+        instructions=[ix],
+        address_lookup_table_accounts=[],
+        recent_blockhash=recent_blockhash,
+    )
+    tx = VersionedTransaction(msg, [payer_keypair])
+
+    # 5) Send and (optionally) confirm
+    _sig = await rpc.send_raw_transaction(bytes(tx))
+    # Optional lightweight confirm loop:
+    # await rpc.confirm_transaction(sig.value)
 
-        # 4) Message + tx: payer is the owner (not the facilitator)
-        msg = MessageV0.try_compile(
-            payer=payer,
-            instructions=[ix],
-            address_lookup_table_accounts=[],
-            recent_blockhash=recent_blockhash,
-        )
-        tx = VersionedTransaction(msg, [payer_keypair])
-
-        # 5) Send and (optionally) confirm
-        _sig = await rpc.send_raw_transaction(bytes(tx))
-        # Optional lightweight confirm loop:
-        # await rpc.confirm_transaction(sig.value)
-
-        return ata
+    return ata, False
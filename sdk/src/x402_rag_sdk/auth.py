@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-import base64
+import binascii
+import functools
 import json
 from datetime import UTC, datetime
 
@@ -11,14 +12,17 @@ from solders.keypair import Keypair
 
 CANON_PREFIX = "solana-auth-v1"
 
+# Maps the standard base64 alphabet to the URL-safe one
+_B64U_TABLE = bytes.maketrans(b"+/", b"-_")
+
 
 def iso_utc(dt: datetime) -> str:
-    dt = dt.astimezone(UTC).replace(microsecond=0)
-    return dt.isoformat().replace("+00:00", "Z")
+    # isoformat of a UTC datetime at seconds precision is "YYYY-MM-DDTHH:MM:SS+00:00"
+    return dt.astimezone(UTC).isoformat(timespec="seconds")[:19] + "Z"
 
 
 def b64u(data: bytes) -> str:
-    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+    return binascii.b2a_base64(data, newline=False).translate(_B64U_TABLE).rstrip(b"=").decode("ascii")
 
 
 class AuthMessage(BaseModel):
@@ -33,12 +37,17 @@ class AuthMessage(BaseModel):
             return v if v.tzinfo else v.replace(tzinfo=UTC)
         return v
 
+    @functools.cached_property
+    def issued_at_iso(self) -> str:
+        """`issued_at` as signed and sent, formatted once for both the canonical string and the payload."""
+        return iso_utc(self.issued_at)
+
     def canonical_string(self) -> bytes:
         lines = [
             CANON_PREFIX,
             f"version: {self.version}",
             f"uri: {self.uri}",
-            f"issued-at: {iso_utc(self.issued_at)}",
+            f"issued-at: {self.issued_at_iso}",
         ]
         return ("\n".join(lines)).encode("utf-8")
 
@@ -46,7 +55,7 @@ class AuthMessage(BaseModel):
         return {
             "v": self.version,
             "uri": str(self.uri),
-            "issuedAt": iso_utc(self.issued_at),
+            "issuedAt": self.issued_at_iso,
         }
 
 
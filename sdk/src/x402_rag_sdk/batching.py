@@ -0,0 +1,69 @@
+"""Micro-batching of concurrent requests for the X402 RAG client."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+class RequestBatcher:
+    """Coalesce calls made within a short window into a single batched call.
+
+    Each `submit` queues its item and waits; the first item of a window schedules a flush
+    `window_seconds` later, which hands every queued item to `send_batch` at once. `send_batch`
+    must return one result per item, in order; a result that is an exception is raised to
+    that item's caller only. If `send_batch` itself raises, every caller in the batch gets the error.
+    """
+
+    def __init__(
+        self,
+        send_batch: Callable[[list[Any]], Awaitable[list[Any]]],
+        window_seconds: float,
+        max_batch_size: int = 32,
+    ):
+        self._send_batch = send_batch
+        self.window_seconds = window_seconds
+        self.max_batch_size = max_batch_size
+        self._pending: list[tuple[Any, asyncio.Future]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # Keep references to in-flight batches so they aren't garbage collected mid-request
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, item: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush_now()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window_seconds, self._flush_now)
+
+        return await future
+
+    def _flush_now(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[Any, asyncio.Future]]) -> None:
+        try:
+            results = await self._send_batch([item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results, strict=True):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
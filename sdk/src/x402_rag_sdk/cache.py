@@ -0,0 +1,160 @@
+"""In-memory response caches for the X402 RAG client."""
+
+import asyncio
+import math
+import random
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Sequence
+from typing import Any
+
+
+class TTLCache:
+    """Size-bounded LRU cache whose entries expire `ttl` seconds after being stored.
+
+    A `maxsize` of 0 disables the cache.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:
+        item = self._data.get(key)
+        if item is None:
+            return None
+
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SemanticCache:
+    """Approximate cache keyed by text embeddings, so paraphrased queries can share a result.
+
+    Vectors are bucketed with random-projection LSH: each of `num_tables` tables hashes a vector
+    to the sign pattern of its dot products with `num_planes` random hyperplanes. A lookup only
+    compares against entries sharing a bucket and returns the most similar one whose cosine
+    similarity is at least `threshold`. Entries are additionally partitioned by an exact `scope`
+    (e.g. the request parameters other than the query text).
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[str], Sequence[float]],
+        threshold: float = 0.95,
+        maxsize: int = 128,
+        ttl: float = 300.0,
+        num_tables: int = 4,
+        num_planes: int = 8,
+        seed: int = 0,
+    ):
+        self.embed = embed
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.num_tables = num_tables
+        self.num_planes = num_planes
+        self._rng = random.Random(seed)
+        # Hyperplanes are drawn on first use, once the embedding dimension is known
+        self._planes: list[list[list[float]]] | None = None
+        self._entries: OrderedDict[int, tuple[float, list[float], Any, list[Hashable]]] = OrderedDict()
+        self._buckets: dict[Hashable, set[int]] = {}
+        self._next_id = 0
+
+    async def aembed(self, text: str) -> list[float]:
+        """Embed `text` in a worker thread and L2-normalize the result."""
+        vec = [float(x) for x in await asyncio.to_thread(self.embed, text)]
+        norm = math.sqrt(sum(x * x for x in vec)) or 1.0
+        return [x / norm for x in vec]
+
+    def _bucket_keys(self, vec: list[float], scope: Hashable) -> list[Hashable]:
+        if self._planes is None:
+            self._planes = [
+                [[self._rng.gauss(0.0, 1.0) for _ in vec] for _ in range(self.num_planes)]
+                for _ in range(self.num_tables)
+            ]
+
+        keys: list[Hashable] = []
+        for table, planes in enumerate(self._planes):
+            signature = 0
+            for plane in planes:
+                signature = (signature << 1) | (sum(p * x for p, x in zip(plane, vec, strict=True)) >= 0)
+            keys.append((scope, table, signature))
+        return keys
+
+    def get(self, vec: list[float], scope: Hashable) -> Any | None:
+        now = time.monotonic()
+        candidates = set().union(*(self._buckets.get(key, ()) for key in self._bucket_keys(vec, scope)))
+
+        best_id: int | None = None
+        best_sim = self.threshold
+        for entry_id in candidates:
+            expires_at, entry_vec, _, _ = self._entries[entry_id]
+            if expires_at <= now:
+                self._remove(entry_id)
+                continue
+
+            sim = sum(a * b for a, b in zip(vec, entry_vec, strict=True))
+            if sim >= best_sim:
+                best_id, best_sim = entry_id, sim
+
+        if best_id is None:
+            return None
+
+        self._entries.move_to_end(best_id)
+        return self._entries[best_id][2]
+
+    def set(self, vec: list[float], scope: Hashable, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+
+        keys = self._bucket_keys(vec, scope)
+        entry_id = self._next_id
+        self._next_id += 1
+
+        self._entries[entry_id] = (time.monotonic() + self.ttl, vec, value, keys)
+        for key in keys:
+            self._buckets.setdefault(key, set()).add(entry_id)
+
+        while len(self._entries) > self.maxsize:
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, entry_id: int) -> None:
+        _, _, _, keys = self._entries.pop(entry_id)
+        for key in keys:
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.discard(entry_id)
+                if not bucket:
+                    del self._buckets[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
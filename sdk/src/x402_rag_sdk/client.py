@@ -1,12 +1,24 @@
 """X402 RAG client implementation."""
 
+import asyncio
+import functools
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING
+
 import httpx
+import orjson
+from pydantic import TypeAdapter
 from solders.keypair import Keypair
 
 from .auth import build_solana_authorization_header
+from .batching import RequestBatcher
+from .cache import SemanticCache, TTLCache
 from .config import ClientConfig
 from .exceptions import (
     X402RagConnectionError,
+    X402RagError,
     X402RagHTTPError,
     X402RagTimeoutError,
 )
@@ -22,7 +34,100 @@ from .schemas import (
     SearchResult,
     WebPageToIndex,
 )
-from .x402 import X402SolanaConfig, X402SolanaPayer, build_x_payment_from_402_json
+
+# The x402 payer pulls in solana-py and spl-token, so it is only imported once a client needs to pay
+if TYPE_CHECKING:
+    from .x402 import X402SolanaPayer
+
+# Validate whole input lists in one pydantic-core call (model instances pass through as-is)
+_DOCUMENTS_ADAPTER = TypeAdapter(list[DocumentToIndex])
+_WEB_PAGES_ADAPTER = TypeAdapter(list[WebPageToIndex])
+# Body of a /docs/search/batch response
+_SEARCH_BATCH_ADAPTER = TypeAdapter(dict[str, list[SearchResult]])
+
+# Distinct requests whose last 402 payment requirements are kept for `x402_prepay_ttl`
+_PREPAY_REQUIREMENTS_SIZE = 256
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_keypair(keypair_bytes: bytes) -> Keypair:
+    """Load a keypair once per key, shared by all clients using it."""
+    return Keypair.from_bytes(keypair_bytes)
+
+
+# Shared x402 payers: (event loop, keypair, RPC endpoints, lookup tables) -> [payer, clients using it].
+# A payer's lock and RPC connections belong to one event loop, so payers aren't shared across loops,
+# and a payer is closed once the last client using it is closed.
+_payers: dict[tuple, list] = {}
+
+
+def _acquire_payer(key: tuple) -> "X402SolanaPayer":
+    """Return the shared payer for `key`, building it on first use, and count one more client using it."""
+    entry = _payers.get(key)
+    if entry is None:
+        from .x402 import X402SolanaConfig, X402SolanaPayer
+
+        _, keypair_bytes, rpc_by_network, lookup_tables = key
+        x402_config = X402SolanaConfig(
+            rpc_by_network=dict(rpc_by_network) if rpc_by_network is not None else None,
+            address_lookup_tables={n: list(a) for n, a in lookup_tables} if lookup_tables is not None else None,
+        )
+        entry = _payers[key] = [X402SolanaPayer(_load_keypair(keypair_bytes), x402_config), 0]
+    entry[1] += 1
+    return entry[0]
+
+
+async def _release_payer(key: tuple) -> None:
+    """Count one less client using the payer for `key`, closing it when none is left."""
+    entry = _payers[key]
+    entry[1] -= 1
+    if entry[1] == 0:
+        del _payers[key]
+        await entry[0].close()
+
+
+# Process-wide clients handed out by `X402RagClient.get_or_create`, one per distinct config. Keyed
+# on a `ClientConfig.key()` snapshot, so mutating a config afterwards can't orphan its client.
+_shared_clients: dict[tuple, "X402RagClient"] = {}
+
+
+def _client_error(e: Exception) -> X402RagError:
+    """Map an exception raised while talking to the server to the SDK exception types."""
+    if isinstance(e, httpx.HTTPStatusError):
+        detail = "Unknown error"
+        # Only JSON bodies carry a detail; proxies and gateways may answer with HTML or plain text
+        if e.response.headers.get("content-type", "").startswith("application/json"):
+            try:
+                detail = orjson.loads(e.response.content).get("detail", detail)
+            except (orjson.JSONDecodeError, AttributeError):
+                pass
+        return X402RagHTTPError(e.response.status_code, detail)
+    if isinstance(e, httpx.TimeoutException):
+        return X402RagTimeoutError("Request timed out")
+    if isinstance(e, httpx.TransportError):
+        return X402RagConnectionError(f"Connection error: {str(e)}")
+    return X402RagConnectionError(f"Unexpected error: {str(e)}")
+
+
+# Transport errors worth retrying. A request that failed to connect never reached the server,
+# so it is safe to resend even with a payment attached; the others may have been processed.
+_CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+_TRANSIENT_ERRORS = (*_CONNECT_ERRORS, httpx.ReadError, httpx.RemoteProtocolError)
+
+
+async def _gather_limited(coros: list[Awaitable], max_concurrency: int | None) -> list:
+    """`asyncio.gather` with `return_exceptions=True`, running at most `max_concurrency` awaitables at once."""
+    if max_concurrency is not None:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def limited(coro: Awaitable):
+            async with semaphore:
+                return await coro
+
+        coros = [limited(coro) for coro in coros]
+    return await asyncio.gather(*coros, return_exceptions=True)
 
 
 class X402RagClient:
@@ -53,20 +158,69 @@ class X402RagClient:
         """
         self.config = config
         self._client: httpx.AsyncClient | None = None
+        # (keypair, RPC endpoints, lookup tables) the payer is built from, set when payments are enabled
+        self._payer_config: tuple | None = None
+        # Shared payer acquired on the first payment, and its key in `_payers`
         self._x402_payer: X402SolanaPayer | None = None
+        self._payer_key: tuple | None = None
         self._auth_keypair: Keypair | None = None
+        # full URI -> (Authorization header, monotonic time it was built)
+        self._auth_header_cache: dict[str, tuple[str, float]] = {}
+        # (path, request body) -> last 402 response body; the price depends on the payload, not just the path
+        self._requirements: TTLCache = TTLCache(
+            _PREPAY_REQUIREMENTS_SIZE if config.x402_prepay_ttl > 0 else 0, config.x402_prepay_ttl
+        )
+        self._search_cache: TTLCache = TTLCache(config.search_cache_size, config.search_cache_ttl)
+        self._chunk_range_cache: TTLCache = TTLCache(config.search_cache_size, config.search_cache_ttl)
+        # (kind, cache key) -> task of the request currently fetching that result
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        self._semantic_cache: SemanticCache | None = None
+        if config.semantic_cache_embedder is not None:
+            self._semantic_cache = SemanticCache(
+                config.semantic_cache_embedder,
+                threshold=config.semantic_cache_threshold,
+                maxsize=config.search_cache_size,
+                ttl=config.search_cache_ttl,
+            )
+
+        self._search_batcher: RequestBatcher | None = None
+        self._search_batch_supported = True
+        if config.search_batch_window_ms > 0:
+            self._search_batcher = RequestBatcher(self._search_batch, config.search_batch_window_ms / 1000)
 
         # Initialize keypair for auth and x402 if config is provided
         if config.x402_keypair_hex:
-            self._auth_keypair = Keypair.from_bytes(bytes.fromhex(config.x402_keypair_hex))
-            x402_config = X402SolanaConfig(
-                rpc_by_network=config.x402_rpc_by_network,
-            )
-            self._x402_payer = X402SolanaPayer(self._auth_keypair, x402_config)
+            self._auth_keypair = _load_keypair(config.x402_keypair_bytes)
+            self._payer_config = config.x402_payer_key()
+
+    @classmethod
+    def get_or_create(cls, config: ClientConfig) -> "X402RagClient":
+        """Return the process-wide client for `config`, creating it on first use.
+
+        Agents and tool sets built from equal configs then share one connection pool,
+        keypair and x402 payer instead of each opening their own.
+
+        Args:
+            config: Client configuration
+
+        Returns:
+            The shared X402RagClient for this configuration
+        """
+        key = config.key()
+        client = _shared_clients.get(key)
+        if client is None:
+            client = _shared_clients[key] = cls(config)
+        return client
 
     async def __aenter__(self):
         """Async context manager entry."""
         await self._ensure_client()
+        if self.config.prewarm:
+            try:
+                await self.health()
+            except X402RagError:
+                # Only a warm-up; real requests report their own errors
+                pass
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -79,20 +233,84 @@ class X402RagClient:
             self._client = httpx.AsyncClient(
                 base_url=self.config.base_url,
                 timeout=self.config.timeout,
+                http2=self.config.http2,
+                limits=httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_keepalive_connections,
+                    keepalive_expiry=self.config.keepalive_expiry,
+                ),
             )
 
     async def close(self):
-        """Close the HTTP client."""
+        """Close the HTTP client and release the x402 payer, closing its RPC connections if no other client uses it."""
         if self._client is not None:
             await self._client.aclose()
             self._client = None
+        if self._payer_key is not None:
+            key, self._payer_key, self._x402_payer = self._payer_key, None, None
+            await _release_payer(key)
+
+    def clear_cache(self):
+        """Drop all cached search and chunk range results."""
+        self._search_cache.clear()
+        self._chunk_range_cache.clear()
+        if self._semantic_cache is not None:
+            self._semantic_cache.clear()
+
+    async def _single_flight(self, key: tuple, fetch: Callable[[], Awaitable[tuple]]):
+        """Run `fetch` once for concurrent calls with the same `key`, so they share one request and payment.
+
+        `fetch` returns (result, payment-free copy). The call that started it gets the result; the
+        others get a deep copy of the payment-free one, the same as a cache hit.
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            _, shared = await asyncio.shield(task)
+            return shared.model_copy(deep=True)
+
+        task = asyncio.ensure_future(fetch())
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so cancelling the caller doesn't cancel the request the others are waiting on
+        result, _ = await asyncio.shield(task)
+        return result
+
+    def _auth_header(self, path: str) -> str:
+        """Return a signed Authorization header for `path`, reusing a recent one for the same URI."""
+        full_uri = f"{self.config.base_url}{path}"
+        now = time.monotonic()
+
+        cached = self._auth_header_cache.get(full_uri)
+        if cached is not None and now - cached[1] < self.config.auth_header_ttl:
+            return cached[0]
+
+        header = build_solana_authorization_header(
+            keypair=self._auth_keypair,
+            uri=full_uri,
+        )
+        self._auth_header_cache[full_uri] = (header, now)
+        return header
+
+    def _prepare_request(self, path: str, json_data: dict | None) -> tuple[dict[str, str], bytes | None]:
+        """Build the headers and encoded body for a request to `path`."""
+        # The body is encoded with orjson rather than httpx's stdlib json
+        headers = {}
+        content: bytes | None = None
+        if json_data is not None:
+            content = orjson.dumps(json_data)
+            headers["Content-Type"] = "application/json"
+
+        if self._auth_keypair:
+            headers["Authorization"] = self._auth_header(path)
+
+        return headers, content
 
     async def _request(
         self,
         method: str,
         path: str,
         json_data: dict | None = None,
-    ) -> tuple[dict, PaymentInfo | None]:
+    ) -> tuple[bytes, PaymentInfo | None]:
         """Make an HTTP request to the server.
 
         Args:
@@ -101,7 +319,8 @@ class X402RagClient:
             json_data: JSON data to send in the request body
 
         Returns:
-            Tuple of (response JSON, payment info if payment was made)
+            Tuple of (raw JSON response body, payment info if payment was made). The body is left
+            undecoded so callers can validate it straight into a model with `model_validate_json`.
 
         Raises:
             X402RagHTTPError: If the request returns an HTTP error
@@ -110,64 +329,99 @@ class X402RagClient:
         """
         await self._ensure_client()
 
-        # Build headers
-        headers = {}
-        if self._auth_keypair:
-            full_uri = f"{self.config.base_url}{path}"
-            headers["Authorization"] = build_solana_authorization_header(
-                keypair=self._auth_keypair,
-                uri=full_uri,
-            )
-
+        headers, content = self._prepare_request(path, json_data)
         payment_info: PaymentInfo | None = None
 
         try:
-            response = await self._client.request(
-                method=method,
-                url=path,
-                json=json_data,
-                headers=headers,
-            )
+            # Pre-attach a payment built from the last 402 seen for this exact request, saving the 402
+            # round-trip when the price is unchanged. If the server rejects it, the regular 402 flow
+            # below applies and replaces the stale requirements.
+            prepaid: tuple[int, str] | None = None
+            requirements_key = (path, content)
+            cached_requirements = self._requirements.get(requirements_key)
+            if self._payer_config is not None and cached_requirements is not None:
+                try:
+                    x_payment, paid_amount, pay_to = await self._build_payment(cached_requirements)
+                except Exception as e:
+                    # e.g. requirements the payer can no longer satisfy; send the request unpaid instead
+                    logger.debug("Dropping cached payment requirements for %s: %s", path, e)
+                    self._requirements.discard(requirements_key)
+                else:
+                    headers["X-PAYMENT"] = x_payment
+                    prepaid = (paid_amount, pay_to)
+
+            response = await self._send(method, path, content, headers)
+
+            # The server only settles (and sets X-PAYMENT-RESPONSE) when the request needed payment
+            if prepaid and response.status_code != 402 and "X-PAYMENT-RESPONSE" in response.headers:
+                payment_info = PaymentInfo(paid_amount=prepaid[0], pay_to=prepaid[1])
 
             # Handle 402 Payment Required if x402 payer is configured
-            if response.status_code == 402 and self._x402_payer:
+            if response.status_code == 402 and self._payer_config is not None:
                 # Parse the 402 body and build payment
-                body = response.json()
+                body = orjson.loads(response.content)
+                self._requirements.set(requirements_key, body)
 
                 # Build payment and extract payment info
-                x_payment, paid_amount, pay_to = await build_x_payment_from_402_json(
-                    payer=self._x402_payer,
-                    x402_body=body,
-                    asset_decimals=self.config.x402_asset_decimals,
-                )
+                x_payment, paid_amount, pay_to = await self._build_payment(body)
 
                 # Retry with X-PAYMENT header (keep Authorization header)
                 headers["X-PAYMENT"] = x_payment
-                response = await self._client.request(
-                    method=method,
-                    url=path,
-                    json=json_data,
-                    headers=headers,
-                )
+                response = await self._send(method, path, content, headers)
 
                 # Create payment info after successful payment
                 payment_info = PaymentInfo(paid_amount=paid_amount, pay_to=pay_to)
 
             response.raise_for_status()
-            return response.json(), payment_info
-        except httpx.HTTPStatusError as e:
-            detail = "Unknown error"
+            return response.content, payment_info
+        except httpx.HTTPError as e:
+            raise _client_error(e) from e
+
+    async def _build_payment(self, x402_body: dict) -> tuple[str, int, str]:
+        """Build the X-PAYMENT header for a 402 response body; returns (header, amount paid, recipient)."""
+        from .x402 import build_x_payment_from_402_json
+
+        if self._x402_payer is None:
+            self._payer_key = (asyncio.get_running_loop(), *self._payer_config)
+            self._x402_payer = _acquire_payer(self._payer_key)
+
+        return await build_x_payment_from_402_json(
+            payer=self._x402_payer,
+            x402_body=x402_body,
+            asset_decimals=self.config.x402_asset_decimals,
+        )
+
+    async def _send(self, method: str, path: str, content: bytes | None, headers: dict[str, str]) -> httpx.Response:
+        """Send a request, retrying transient transport errors with exponential backoff.
+
+        Once an X-PAYMENT header is attached only connection failures are retried, since any
+        other error may come after the server settled the payment and a resend would pay twice.
+        """
+        retriable = _CONNECT_ERRORS if "X-PAYMENT" in headers else _TRANSIENT_ERRORS
+        attempt = 0
+        while True:
             try:
-                detail = e.response.json().get("detail", detail)
-            except Exception:
-                pass
-            raise X402RagHTTPError(e.response.status_code, detail) from e
-        except httpx.TimeoutException as e:
-            raise X402RagTimeoutError("Request timed out") from e
-        except httpx.ConnectError as e:
-            raise X402RagConnectionError(f"Connection error: {str(e)}") from e
-        except Exception as e:
-            raise X402RagConnectionError(f"Unexpected error: {str(e)}") from e
+                response = await self._client.request(method=method, url=path, content=content, headers=headers)
+            except retriable:
+                if attempt >= self.config.max_retries:
+                    raise
+                await asyncio.sleep(self.config.retry_backoff * 2**attempt)
+                attempt += 1
+            else:
+                # Shows whether HTTP/2 was negotiated with the server
+                logger.debug("%s %s: %s over %s", method, path, response.status_code, response.http_version)
+                return response
+
+    async def health(self) -> dict:
+        """Check that the server is up.
+
+        Also useful to keep pooled connections alive during idle periods.
+
+        Returns:
+            The server's health status, e.g. {"status": "healthy"}
+        """
+        response, _ = await self._request("GET", "/health")
+        return orjson.loads(response)
 
     async def index_docs(
         self,
@@ -189,11 +443,13 @@ class X402RagClient:
             ... ])
         """
         # Convert dicts to DocumentToIndex if needed
-        doc_list = [doc if isinstance(doc, DocumentToIndex) else DocumentToIndex(**doc) for doc in documents]
+        doc_list = _DOCUMENTS_ADAPTER.validate_python(documents)
+        # A path listed more than once is indexed with its last price, as the server does within one request
+        doc_list = list({doc.path: doc for doc in doc_list}.values())
 
-        request = IndexDocsRequest(documents=doc_list)
-        response, _ = await self._request("POST", "/docs/index", request.model_dump())
-        return IndexResult(**response)
+        return await self._index_in_batches(
+            "/docs/index", doc_list, lambda batch: IndexDocsRequest(documents=batch).model_dump()
+        )
 
     async def index_web_pages(
         self,
@@ -215,17 +471,43 @@ class X402RagClient:
             ... ])
         """
         # Convert dicts to WebPageToIndex if needed
-        page_list = [page if isinstance(page, WebPageToIndex) else WebPageToIndex(**page) for page in pages]
+        page_list = _WEB_PAGES_ADAPTER.validate_python(pages)
+        # A URL listed more than once is indexed with its last price, as the server does within one request
+        page_list = list({page.url: page for page in page_list}.values())
 
-        request = IndexWebPagesRequest(pages=page_list)
-        response, _ = await self._request("POST", "/docs/index/web", request.model_dump())
-        return IndexResult(**response)
+        return await self._index_in_batches(
+            "/docs/index/web", page_list, lambda batch: IndexWebPagesRequest(pages=batch).model_dump()
+        )
+
+    async def _index_in_batches(self, path: str, items: list, build_request: Callable[[list], dict]) -> IndexResult:
+        """Send `items` to an indexing endpoint in batches of `index_batch_size`, a few requests at a time.
+
+        Large lists then don't go out as one huge request, and the server embeds one batch while
+        the next is being sent.
+        """
+        batch_size = self.config.index_batch_size
+        semaphore = asyncio.Semaphore(self.config.index_max_concurrency)
+
+        async def index_batch(batch: list) -> IndexResult:
+            async with semaphore:
+                response, _ = await self._request("POST", path, build_request(batch))
+            return IndexResult.model_validate_json(response)
+
+        try:
+            results = await asyncio.gather(
+                *[index_batch(items[start : start + batch_size]) for start in range(0, len(items), batch_size)]
+            )
+        finally:
+            # Newly indexed content may change search results, even if some of the batches failed
+            self.clear_cache()
+        return IndexResult(indexed_documents=[doc for result in results for doc in result.indexed_documents])
 
     async def search(
         self,
         query: str,
         k: int = 5,
         filters: dict[str, str] | None = None,
+        no_cache: bool = False,
     ) -> SearchResult:
         """Search for documents similar to the query text.
 
@@ -233,6 +515,17 @@ class X402RagClient:
             query: Search query text
             k: Number of results to return (default: 5)
             filters: Optional metadata filters to apply
+            no_cache: Always ask the server, and don't cache the result (default: False)
+
+        Results are cached in memory (see `ClientConfig.search_cache_size`); a cached result
+        is returned without contacting the server and without making a payment, so its
+        `payment` field is None. If `ClientConfig.semantic_cache_embedder` is set, a query
+        similar enough to a cached one (same `k` and `filters`) is also served from the cache.
+        Identical searches made while one is in flight wait for it and get a copy of its result,
+        with `payment` None, instead of sending and paying for their own request.
+
+        With `ClientConfig.search_batch_window_ms` set, concurrent searches are sent together in
+        one request and paid for once; the payment is reported on the first result of the batch.
 
         Returns:
             SearchResult containing matching document chunks
@@ -242,13 +535,75 @@ class X402RagClient:
             >>> for chunk in result.chunks:
             ...     print(chunk.text)
         """
-        request = SearchRequest(query=query, k=k, filters=filters)
-        response, payment_info = await self._request("POST", "/docs/search", request.model_dump())
-        result = SearchResult(**response)
+        # Hot path: send the request body as a plain dict, the server validates it
+        json_data = {"query": query, "k": k, "filters": filters}
+        if no_cache:
+            return await self._search_uncached(json_data)
+
+        scope = (k, tuple(sorted((filters or {}).items())))
+        cache_key = (query, *scope)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
+        return await self._single_flight(
+            ("search", cache_key), lambda: self._search_cache_miss(query, json_data, cache_key, scope)
+        )
+
+    async def _search_cache_miss(
+        self, query: str, json_data: dict, cache_key: tuple, scope: tuple
+    ) -> tuple[SearchResult, SearchResult]:
+        """Serve a search missing from the exact cache, returning (result, payment-free cached copy)."""
+        query_vec: list[float] | None = None
+        if self._semantic_cache is not None:
+            query_vec = await self._semantic_cache.aembed(query)
+            cached = self._semantic_cache.get(query_vec, scope)
+            if cached is not None:
+                return cached.model_copy(deep=True), cached
+
+        result = await self._search_uncached(json_data)
+
+        cache_copy = result.model_copy(update={"payment": None}, deep=True)
+        self._search_cache.set(cache_key, cache_copy)
+        if query_vec is not None:
+            self._semantic_cache.set(query_vec, scope, cache_copy)
+        return result, cache_copy
+
+    async def _search_uncached(self, json_data: dict) -> SearchResult:
+        if self._search_batcher is not None:
+            return await self._search_batcher.submit(json_data)
+        return await self._post_search(json_data)
+
+    async def _post_search(self, json_data: dict) -> SearchResult:
+        """Send one search request and attach its payment info to the result."""
+        response, payment_info = await self._request("POST", "/docs/search", json_data)
+        result = SearchResult.model_validate_json(response)
         if payment_info:
             result.payment = payment_info
         return result
 
+    async def _search_batch(self, queries: list[dict]) -> list[SearchResult | Exception]:
+        """Send queued searches as one `/docs/search/batch` request.
+
+        The payment made for the batch is attached to the first result. Against a server
+        without the batch endpoint the searches are sent individually instead.
+        """
+        if len(queries) == 1 or not self._search_batch_supported:
+            return await asyncio.gather(*[self._post_search(q) for q in queries], return_exceptions=True)
+
+        try:
+            response, payment_info = await self._request("POST", "/docs/search/batch", {"queries": queries})
+        except X402RagHTTPError as e:
+            if e.status_code not in (404, 405):
+                raise
+            self._search_batch_supported = False
+            return await asyncio.gather(*[self._post_search(q) for q in queries], return_exceptions=True)
+
+        results = _SEARCH_BATCH_ADAPTER.validate_json(response)["results"]
+        if payment_info:
+            results[0].payment = payment_info
+        return results
+
     async def get_chunk_range(
         self,
         doc_id: str,
@@ -262,6 +617,8 @@ class X402RagClient:
             start_chunk: Starting chunk index (inclusive)
             end_chunk: Ending chunk index (inclusive, optional)
 
+        Results are cached in memory, and concurrent identical calls share one request, like `search` results.
+
         Returns:
             FetchChunksByRangeResult containing the requested chunks
 
@@ -269,13 +626,87 @@ class X402RagClient:
             >>> result = await client.get_chunk_range("doc123", 0, 10)
             >>> print(f"Retrieved {result.total} chunks")
         """
-        request = FetchChunksByRangeRequest(
-            doc_id=doc_id,
-            start_chunk=start_chunk,
-            end_chunk=end_chunk,
-        )
-        response, payment_info = await self._request("POST", "/docs/chunks", request.model_dump())
-        result = FetchChunksByRangeResult(**response)
+        cache_key = (doc_id, start_chunk, end_chunk)
+        cached = self._chunk_range_cache.get(cache_key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
+        return await self._single_flight(("chunks", cache_key), lambda: self._fetch_chunk_range(cache_key))
+
+    async def _fetch_chunk_range(
+        self, cache_key: tuple[str, int, int | None]
+    ) -> tuple[FetchChunksByRangeResult, FetchChunksByRangeResult]:
+        """Fetch a chunk range from the server, returning (result, payment-free cached copy)."""
+        doc_id, start_chunk, end_chunk = cache_key
+        # Hot path: send the request body as a plain dict, the server validates it
+        json_data = {"doc_id": doc_id, "start_chunk": start_chunk, "end_chunk": end_chunk}
+        response, payment_info = await self._request("POST", "/docs/chunks", json_data)
+        result = FetchChunksByRangeResult.model_validate_json(response)
+        cache_copy = result.model_copy(deep=True)
+        self._chunk_range_cache.set(cache_key, cache_copy)
         if payment_info:
             result.payment = payment_info
-        return result
+        return result, cache_copy
+
+    async def search_many(
+        self,
+        queries: list[SearchRequest] | list[dict],
+        max_concurrency: int | None = None,
+    ) -> list[SearchResult | BaseException]:
+        """Run several searches concurrently.
+
+        Args:
+            queries: List of search requests.
+                Each request should have a 'query' field and optional 'k' and 'filters' fields.
+            max_concurrency: Maximum number of searches in flight at once (default: no limit).
+                Over HTTP/2 they share one connection either way.
+
+        Returns:
+            One entry per request, in the same order: the SearchResult, or the exception
+            raised by that search
+
+        Example:
+            >>> results = await client.search_many([
+            ...     {"query": "machine learning", "k": 5},
+            ...     {"query": "vector databases", "k": 3},
+            ... ])
+        """
+        # Validate dicts into SearchRequest (model instances pass through as-is)
+        request_list = [SearchRequest.model_validate(q) for q in queries]
+
+        return await _gather_limited(
+            [self.search(query=r.query, k=r.k, filters=r.filters) for r in request_list], max_concurrency
+        )
+
+    async def get_chunk_range_many(
+        self,
+        ranges: list[FetchChunksByRangeRequest] | list[dict],
+        max_concurrency: int | None = None,
+    ) -> list[FetchChunksByRangeResult | BaseException]:
+        """Fetch several chunk ranges concurrently.
+
+        Args:
+            ranges: List of chunk range requests.
+                Each request should have 'doc_id' and 'start_chunk' fields and an optional 'end_chunk' field.
+            max_concurrency: Maximum number of fetches in flight at once (default: no limit)
+
+        Returns:
+            One entry per request, in the same order: the FetchChunksByRangeResult, or the exception
+            raised by that fetch
+
+        Example:
+            >>> results = await client.get_chunk_range_many([
+            ...     {"doc_id": "doc123", "start_chunk": 0, "end_chunk": 3},
+            ...     {"doc_id": "doc456", "start_chunk": 10},
+            ... ])
+        """
+        # Validate dicts into FetchChunksByRangeRequest (model instances pass through as-is)
+        request_list = [FetchChunksByRangeRequest.model_validate(r) for r in ranges]
+
+        return await _gather_limited(
+            [
+                self.get_chunk_range(doc_id=r.doc_id, start_chunk=r.start_chunk, end_chunk=r.end_chunk)
+                for r in request_list
+            ],
+            max_concurrency,
+        )
@@ -1,5 +1,21 @@
 """Configuration for the X402 RAG client."""
 
+import functools
+from collections.abc import Callable, Sequence
+from typing import Any
+
+# Cached properties of ClientConfig, excluded from equality and hashing
+_DERIVED_ATTRIBUTES = frozenset({"x402_keypair_bytes"})
+
+
+def _freeze(value: Any) -> Any:
+    """Turn dicts (into sorted item tuples) and lists (into tuples) into hashable values, recursively."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
 
 class ClientConfig:
     """Configuration for the X402 RAG client.
@@ -10,6 +26,31 @@ class ClientConfig:
         x402_keypair_hex: 64-byte keypair hex string for authentication and x402 payments
         x402_rpc_by_network: RPC endpoints by network for x402 payments (optional)
         x402_asset_decimals: Asset decimals for x402 payments (default: 6 for USDC)
+        http2: Use HTTP/2 for connections to the server (default: True)
+        prewarm: Open a connection with a `GET /health` when entering the client's context, so
+            the first real request doesn't pay for the TCP/TLS handshake (default: True)
+        max_connections: Maximum number of concurrent connections in the pool (default: 100)
+        max_keepalive_connections: Maximum number of idle connections kept alive (default: 20)
+        keepalive_expiry: Seconds an idle connection is kept alive (default: 30)
+        search_cache_size: Maximum number of cached search/chunk range results, 0 disables caching (default: 128)
+        search_cache_ttl: Seconds a cached result stays valid (default: 300)
+        semantic_cache_embedder: Function embedding a query text into a vector. When set, searches
+            that miss the exact cache are also looked up by embedding similarity (default: None)
+        semantic_cache_threshold: Minimum cosine similarity for a semantic cache hit (default: 0.95)
+        auth_header_ttl: Seconds a signed Authorization header is reused for the same URI, 0 signs
+            every request. Must stay well below the server's message TTL (default: 60)
+        x402_prepay_ttl: Seconds the last 402 payment requirements of a request (endpoint and body)
+            are reused to attach a payment up front when it is sent again, skipping the 402
+            round-trip when the price is unchanged; 0 disables (default: 0)
+        search_batch_window_ms: Milliseconds concurrent `search` calls are collected and sent as one
+            `/docs/search/batch` request with a single payment; 0 sends each search on its own (default: 0)
+        max_retries: Times a request is resent after a transient network error. Requests carrying a
+            payment are only resent when the connection could not be established (default: 2)
+        retry_backoff: Seconds to wait before the first retry, doubled on each further retry (default: 0.2)
+        x402_address_lookup_tables: Address lookup table addresses by network to compile payment
+            transactions against, shrinking them; the tables must hold the mint and token accounts (optional)
+        index_batch_size: Maximum number of documents or web pages sent in one indexing request (default: 32)
+        index_max_concurrency: Maximum number of indexing requests in flight at once (default: 4)
     """
 
     def __init__(
@@ -19,9 +60,77 @@ class ClientConfig:
         timeout: int = 30,
         x402_rpc_by_network: dict[str, str] | None = None,
         x402_asset_decimals: int | None = None,
+        http2: bool = True,
+        prewarm: bool = True,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        search_cache_size: int = 128,
+        search_cache_ttl: float = 300.0,
+        semantic_cache_embedder: Callable[[str], Sequence[float]] | None = None,
+        semantic_cache_threshold: float = 0.95,
+        auth_header_ttl: float = 60.0,
+        x402_prepay_ttl: float = 0.0,
+        search_batch_window_ms: float = 0.0,
+        max_retries: int = 2,
+        retry_backoff: float = 0.2,
+        x402_address_lookup_tables: dict[str, list[str]] | None = None,
+        index_batch_size: int = 32,
+        index_max_concurrency: int = 4,
     ):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.x402_keypair_hex = x402_keypair_hex
         self.x402_rpc_by_network = x402_rpc_by_network
         self.x402_asset_decimals = x402_asset_decimals
+        self.http2 = http2
+        self.prewarm = prewarm
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.search_cache_size = search_cache_size
+        self.search_cache_ttl = search_cache_ttl
+        self.semantic_cache_embedder = semantic_cache_embedder
+        self.semantic_cache_threshold = semantic_cache_threshold
+        self.auth_header_ttl = auth_header_ttl
+        self.x402_prepay_ttl = x402_prepay_ttl
+        self.search_batch_window_ms = search_batch_window_ms
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.x402_address_lookup_tables = x402_address_lookup_tables
+        self.index_batch_size = index_batch_size
+        self.index_max_concurrency = index_max_concurrency
+
+    @functools.cached_property
+    def x402_keypair_bytes(self) -> bytes:
+        """The keypair decoded from `x402_keypair_hex`, computed once per config."""
+        return bytes.fromhex(self.x402_keypair_hex)
+
+    def key(self) -> tuple:
+        """Hashable snapshot of the current settings.
+
+        Registries keyed on a config should store this rather than the config itself, so that
+        mutating the config afterwards doesn't leave the stored entry unreachable.
+        """
+        # Dict- and list-valued settings are frozen into tuples so the key is hashable. Cached
+        # properties also live in vars(), but are derived from the settings, so they're skipped
+        # to keep the hash stable once they've been computed.
+        return tuple(
+            (name, _freeze(value)) for name, value in sorted(vars(self).items()) if name not in _DERIVED_ATTRIBUTES
+        )
+
+    def x402_payer_key(self) -> tuple:
+        """Hashable (keypair bytes, RPC endpoints, lookup tables) the x402 payer is built from."""
+        return (
+            self.x402_keypair_bytes,
+            _freeze(self.x402_rpc_by_network),
+            _freeze(self.x402_address_lookup_tables),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ClientConfig):
+            return NotImplemented
+        return self.key() == other.key()
+
+    def __hash__(self) -> int:
+        return hash(self.key())
@@ -1,10 +1,16 @@
-import base64
-import json
+import asyncio
 import logging
+import time
 from dataclasses import dataclass
+from functools import lru_cache, partial
+from operator import itemgetter
 from typing import Any
 
+import orjson
+import pybase64
 from solana.rpc.async_api import AsyncClient
+from solders.address_lookup_table_account import AddressLookupTable, AddressLookupTableAccount
+from solders.hash import Hash
 from solders.instruction import Instruction
 from solders.keypair import Keypair
 from solders.message import MessageV0
@@ -12,13 +18,9 @@ from solders.pubkey import Pubkey
 from solders.solders import NullSigner
 from solders.transaction import VersionedTransaction
 from spl.token.constants import TOKEN_PROGRAM_ID
-from spl.token.instructions import (
-    TransferCheckedParams,
-    get_associated_token_address,
-    transfer_checked,
-)
+from spl.token.instructions import TransferCheckedParams, transfer_checked
 
-from .ata import ensure_ata_exists
+from .ata import associated_token_address, ensure_ata_exists
 
 logger = logging.getLogger(__name__)
 
@@ -31,15 +33,32 @@ DEFAULT_RPC = {
 COMPUTE_BUDGET_PROGRAM_ID = Pubkey.from_string("ComputeBudget111111111111111111111111111111")
 
 
+@lru_cache(maxsize=1024)
+def _pubkey(address: str) -> Pubkey:
+    # The same mint / recipient / fee payer addresses come back on every payment
+    return Pubkey.from_string(address)
+
+
 @dataclass
 class X402SolanaConfig:
     """Config for making Solana x402 payments."""
 
     rpc_by_network: dict[str, str] = None  # e.g. {"solana": "...", "solana-devnet": "..."}
+    # Seconds a fetched blockhash is reused for new payments; it stays valid on-chain for ~60s
+    blockhash_ttl: float = 10.0
+    # Address lookup tables to compile payments against, by network, e.g. {"solana": ["<ALT address>"]}.
+    # Create one per deployment holding the mint and the token accounts; signers and program ids
+    # can't be looked up.
+    address_lookup_tables: dict[str, list[str]] = None
+    # Timeout (seconds) and optional proxy URL for the RPC connections
+    rpc_timeout: float = 10.0
+    rpc_proxy: str | None = None
 
     def __post_init__(self):
         if self.rpc_by_network is None:
             self.rpc_by_network = DEFAULT_RPC
+        if self.address_lookup_tables is None:
+            self.address_lookup_tables = {}
 
 
 class X402SolanaPayer:
@@ -47,15 +66,121 @@ class X402SolanaPayer:
 
     def __init__(self, keypair: Keypair, cfg: X402SolanaConfig):
         self._kp = keypair
+        self._owner = keypair.pubkey()
         self._cfg = cfg
+        # network -> (recent blockhash, monotonic time it was fetched)
+        self._blockhashes: dict[str, tuple[Hash, float]] = {}
+        self._blockhash_lock = asyncio.Lock()
+        # (network, owner, mint) -> source ATA found on-chain by an earlier check
+        self._known_atas: dict[tuple[str, Pubkey, Pubkey], Pubkey] = {}
+        # network -> lookup table accounts, fetched on first use
+        self._lookup_tables: dict[str, list[AddressLookupTableAccount]] = {}
+        # network -> RPC client kept open across payments, so its connection is reused
+        self._rpc_clients: dict[str, AsyncClient] = {}
+
+    def _rpc(self, network: str) -> AsyncClient:
+        rpc = self._rpc_clients.get(network)
+        if rpc is None:
+            rpc = self._rpc_clients[network] = AsyncClient(
+                self._cfg.rpc_by_network[network], timeout=self._cfg.rpc_timeout, proxy=self._cfg.rpc_proxy
+            )
+        return rpc
+
+    async def close(self) -> None:
+        """
+        Close the RPC clients. Call on shutdown; the payer stays usable and reopens them on demand.
+        """
+        rpc_clients, self._rpc_clients = self._rpc_clients, {}
+        for rpc in rpc_clients.values():
+            await rpc.close()
+
+    def _fresh_blockhash(self, network: str) -> Hash | None:
+        cached = self._blockhashes.get(network)
+        if cached is not None and time.monotonic() - cached[1] < self._cfg.blockhash_ttl:
+            return cached[0]
+        return None
+
+    async def _refresh_blockhash(self, network: str, rpc: AsyncClient) -> Hash:
+        blockhash = (await rpc.get_latest_blockhash()).value.blockhash
+        self._blockhashes[network] = (blockhash, time.monotonic())
+        return blockhash
+
+    async def _ensure_source_ata(self, network: str, owner: Pubkey, mint: Pubkey) -> Pubkey:
+        # An ATA stays in place once it exists, so it is only checked until it has been found on-chain;
+        # a create tx that was just sent may still be dropped, so that ATA is checked again next time.
+        # Creating one uses the cached blockhash, which the payment being built fetches concurrently.
+        key = (network, owner, mint)
+        ata = self._known_atas.get(key)
+        if ata is None:
+            ata, found = await ensure_ata_exists(
+                rpc=self._rpc(network),
+                payer_keypair=self._kp,
+                owner_pubkey=owner,
+                mint_pubkey=mint,
+                get_blockhash=partial(self.get_cached_blockhash, network),
+            )
+            if found:
+                self._known_atas[key] = ata
+        return ata
+
+    async def _lookup_table_accounts(self, network: str) -> list[AddressLookupTableAccount]:
+        tables = self._lookup_tables.get(network)
+        if tables is None:
+            tables = []
+            rpc = self._rpc(network)
+            for address in self._cfg.address_lookup_tables.get(network, []):
+                key = _pubkey(address)
+                info = await rpc.get_account_info(key)
+                if info.value is None:
+                    raise ValueError(f"Address lookup table {address} not found on '{network}'.")
+                table = AddressLookupTable.deserialize(info.value.data)
+                tables.append(AddressLookupTableAccount(key=key, addresses=list(table.addresses)))
+            self._lookup_tables[network] = tables
+        return tables
+
+    async def get_cached_blockhash(self, network: str) -> Hash:
+        """
+        Return a recent blockhash for `network`, fetching it only when the cached one is older
+        than `blockhash_ttl`. Concurrent callers share a single fetch.
+        """
+        blockhash = self._fresh_blockhash(network)
+        if blockhash is not None:
+            return blockhash
+
+        async with self._blockhash_lock:
+            # Another caller may have refreshed it while we waited
+            blockhash = self._fresh_blockhash(network)
+            if blockhash is not None:
+                return blockhash
 
+            return await self._refresh_blockhash(network, self._rpc(network))
+
+    async def start_blockhash_updater(self, network: str, interval: float = 5.0) -> None:
+        """
+        Keep the cached blockhash for `network` fresh so payments never wait on the RPC for it.
+
+        Runs until cancelled; start it as a background task, e.g.
+        `asyncio.create_task(payer.start_blockhash_updater("solana"))`. Failed refreshes are
+        logged and retried on the next tick, payments fall back to fetching on demand meanwhile.
+        """
+        while True:
+            try:
+                await self._refresh_blockhash(network, self._rpc(network))
+            except Exception as e:
+                logger.warning(f"Failed to refresh blockhash for {network}: {e}")
+            await asyncio.sleep(interval)
+
+    # Compute budget instructions only depend on their argument, which rarely changes between
+    # payments, so they are built once per value
     @staticmethod
+    @lru_cache(maxsize=64)
     def _ix_set_cu_limit(units: int) -> Instruction:
         # ComputeBudget program: discriminator 2 + u32 little-endian
         data = bytes([2]) + int(units).to_bytes(4, "little")
         return Instruction(COMPUTE_BUDGET_PROGRAM_ID, data, [])
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def _ix_set_cu_price(microlamports_per_cu: int) -> Instruction:
         # ComputeBudget program: discriminator 3 + u64 little-endian
         # NOTE: facilitator caps this at 5_000_000 microlamports per CU.
@@ -99,18 +224,18 @@ class X402SolanaPayer:
 
         decimals = 6 if asset_decimals is None else int(asset_decimals)
 
-        mint = Pubkey.from_string(mint_str)
-        recipient = Pubkey.from_string(pay_to_str)
-        fee_payer = Pubkey.from_string(fee_payer_str)
-        owner = self._kp.pubkey()
-
-        rpc_endpoint = self._cfg.rpc_by_network[network]
+        mint = _pubkey(mint_str)
+        recipient = _pubkey(pay_to_str)
+        fee_payer = _pubkey(fee_payer_str)
+        owner = self._owner
 
-        # ---- 2) Resolve ATAs ----
-        src_ata = await ensure_ata_exists(
-            rpc_url=rpc_endpoint, payer_keypair=self._kp, owner_pubkey=owner, mint_pubkey=mint
+        # ---- 2) Resolve ATAs, the blockhash and lookup tables (independent RPC calls, issued concurrently) ----
+        src_ata, recent_blockhash, lookup_tables = await asyncio.gather(
+            self._ensure_source_ata(network, owner, mint),
+            self.get_cached_blockhash(network),
+            self._lookup_table_accounts(network),
         )
-        dst_ata = get_associated_token_address(recipient, mint)
+        dst_ata = associated_token_address(recipient, mint)
 
         # ---- 3) Build instruction list: [CB limit, CB price, transfer_checked] ----
         ixs = [
@@ -130,13 +255,10 @@ class X402SolanaPayer:
         ]
 
         # ---- 4) Build a versioned tx (payer = facilitator) and partial-sign (owner only) ----
-        async with AsyncClient(rpc_endpoint) as rpc:
-            recent_blockhash = (await rpc.get_latest_blockhash()).value.blockhash
-
         msg = MessageV0.try_compile(
             payer=fee_payer,  # facilitator pays fees but must NOT appear in instruction accounts
             instructions=ixs,
-            address_lookup_table_accounts=[],
+            address_lookup_table_accounts=lookup_tables,
             recent_blockhash=recent_blockhash,
         )
 
@@ -144,7 +266,7 @@ class X402SolanaPayer:
         tx = VersionedTransaction(msg, [self._kp, NullSigner(fee_payer)])
 
         # ---- 5) Encode and wrap into PaymentPayload dict ----
-        tx_b64 = base64.b64encode(bytes(tx)).decode("utf-8")
+        tx_b64 = pybase64.b64encode_as_string(bytes(tx))
 
         payment_payload = {
             "x402Version": x402_version,
@@ -155,13 +277,13 @@ class X402SolanaPayer:
             },
         }
 
-        return base64.b64encode(json.dumps(payment_payload).encode("utf-8")).decode("utf-8")
+        return pybase64.b64encode_as_string(orjson.dumps(payment_payload))
 
 
 async def build_x_payment_from_402_json(
     payer: X402SolanaPayer,
     x402_body: dict[str, Any],
-    select_requirement=lambda accepts: accepts[0],
+    select_requirement=itemgetter(0),
     asset_decimals: int | None = None,
 ) -> tuple[str, int, str]:
     """
@@ -1,9 +1,8 @@
+import asyncio
+import functools
 import logging
 
-from langchain_community.embeddings import HuggingFaceEmbeddings
 from langchain_core.embeddings import Embeddings
-from langchain_google_genai import GoogleGenerativeAIEmbeddings
-from langchain_openai import OpenAIEmbeddings
 from langchain_postgres.v2.async_vectorstore import AsyncPGVectorStore
 from langchain_postgres.v2.engine import PGEngine
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
@@ -27,23 +26,44 @@ class RuntimeContext:
 
     @classmethod
     async def create(cls, settings: Settings) -> "RuntimeContext":
-        async_engine = create_async_engine(settings.pg_conn)
+        # Sized for concurrent search, purchase lookup and purchase recording on every paid request;
+        # pre-ping drops connections the database closed while they sat idle in the pool
+        async_engine = create_async_engine(
+            settings.pg_conn,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_recycle=settings.db_pool_recycle,
+            pool_timeout=settings.db_pool_timeout,
+            pool_pre_ping=True,
+        )
         engine = PGEngine.from_engine(async_engine)
         embedding_service = create_embedding_service(settings)
 
-        # Initialize chunk_purchases table
-        async with async_engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-
-        try:
-            await engine.ainit_vectorstore_table(
-                table_name="document_chunks",
-                vector_size=settings.embedding_dimension,
-                id_column="id",
-                metadata_json_column="metadata",
-            )
-        except Exception:
-            logger.info("Vector store tables already initialized")
+        async def warm_up_embeddings():
+            # Run one embedding up front so loading the local model and its kernels doesn't land
+            # on the first user request
+            if settings.embedding_provider == "hf":
+                await asyncio.to_thread(embedding_service.embed_query, "warmup")
+
+        async def init_app_tables():
+            # Initialize chunk_purchases table
+            async with async_engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+
+        async def init_vector_table():
+            try:
+                await engine.ainit_vectorstore_table(
+                    table_name="document_chunks",
+                    vector_size=settings.embedding_dimension,
+                    id_column="id",
+                    metadata_json_column="metadata",
+                )
+            except Exception:
+                logger.info("Vector store tables already initialized")
+
+        # The two tables are independent, so create them on separate connections at the same time
+        # (and while the embedding model warms up)
+        await asyncio.gather(init_app_tables(), init_vector_table(), warm_up_embeddings())
 
         doc_store = await AsyncPGVectorStore.create(
             engine=engine,
@@ -59,26 +79,57 @@ class RuntimeContext:
 class FakeEmbeddings(Embeddings):
     def __init__(self):
         self.dimension = 768
+        # Shared immutable zero vector, copied per result since callers may mutate the lists
+        self._zero = (0.0,) * self.dimension
 
     def embed_documents(self, texts: list[str]) -> list[list[float]]:
-        return [[0.0] * self.dimension for _ in texts]
+        zero = self._zero
+        return [list(zero) for _ in texts]
 
     def embed_query(self, text: str) -> list[float]:
-        return [0.0] * self.dimension
+        return list(self._zero)
 
 
 def create_embedding_service(settings: Settings) -> Embeddings:
     if settings.embedding_provider == "openai":
-        return OpenAIEmbeddings(
-            model=settings.openai_model,
-            api_key=settings.openai_api_key,
-        )
+        return _embedding_service("openai", settings.openai_model, settings.openai_api_key, None)
     elif settings.embedding_provider == "gemini":
-        return GoogleGenerativeAIEmbeddings(
-            model=settings.gemini_model,
-            google_api_key=settings.gemini_api_key,
-        )
+        return _embedding_service("gemini", settings.gemini_model, settings.gemini_api_key, None)
     elif settings.embedding_provider == "hf":  # huggingface
-        return HuggingFaceEmbeddings(model_name=settings.hf_model)
+        return _embedding_service("hf", settings.hf_model, None, settings.hf_dtype)
+    else:
+        return _embedding_service("fake", None, None, None)
+
+
+@functools.lru_cache(maxsize=4)
+def _embedding_service(provider: str, model: str | None, api_key: str | None, dtype: str | None) -> Embeddings:
+    # One instance per (provider, model, key, dtype), so contexts created from equal settings share it
+    # instead of each loading the model again. Provider packages are imported here so only the
+    # one in use is loaded.
+    if provider == "openai":
+        from langchain_openai import OpenAIEmbeddings
+
+        return OpenAIEmbeddings(model=model, api_key=api_key)
+    elif provider == "gemini":
+        from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+        return GoogleGenerativeAIEmbeddings(model=model, google_api_key=api_key)
+    elif provider == "hf":
+        return create_hf_embeddings(model, dtype)
     else:
         return FakeEmbeddings()
+
+
+def create_hf_embeddings(model: str, dtype: str) -> Embeddings:
+    # torch comes with sentence-transformers, which is only needed for this provider
+    import torch
+    from langchain_community.embeddings import HuggingFaceEmbeddings
+
+    return HuggingFaceEmbeddings(
+        model_name=model,
+        model_kwargs={
+            "device": "cuda" if torch.cuda.is_available() else "cpu",
+            # Lower precision weights halve the model's memory and speed up inference
+            "model_kwargs": {"torch_dtype": getattr(torch, dtype)},
+        },
+    )
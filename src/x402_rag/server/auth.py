@@ -2,50 +2,59 @@
 
 from __future__ import annotations
 
-import base64
-import json
+import re
+from binascii import a2b_base64
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 
+import orjson
 from nacl.exceptions import BadSignatureError
 from nacl.signing import VerifyKey
-from pydantic import BaseModel, Field, ValidationError, field_validator
 from solders.pubkey import Pubkey
 
 CANON_PREFIX = "solana-auth-v1"
+AUTH_SCHEME = "Solana "
+
+# A well-formed header payload is a few hundred base64url characters; anything longer or
+# outside the alphabet is rejected before decoding
+MAX_PAYLOAD_LENGTH = 2048
+B64U_PAYLOAD_RE = re.compile(r"[A-Za-z0-9_-]+={0,2}")
 
 
 def iso_utc(dt: datetime) -> str:
-    dt = dt.astimezone(UTC).replace(microsecond=0)
-    return dt.isoformat().replace("+00:00", "Z")
+    # isoformat of a UTC datetime at seconds precision is "YYYY-MM-DDTHH:MM:SS+00:00"
+    return dt.astimezone(UTC).isoformat(timespec="seconds")[:19] + "Z"
 
 
 def b64u_decode(s: str) -> bytes:
-    return base64.urlsafe_b64decode(s + "=" * (-len(s) % 4))
+    # What urlsafe_b64decode does, minus its bytes conversion and translate pass
+    return a2b_base64(s.replace("-", "+").replace("_", "/") + "=" * (-len(s) % 4))
 
 
-class AuthMessage(BaseModel):
-    version: int = Field(..., alias="v")
-    uri: str
-    issued_at: datetime = Field(..., alias="issuedAt")
+@lru_cache(maxsize=4096)
+def verify_key_for(address: str) -> VerifyKey:
+    """Build (once per wallet) the key that verifies signatures from `address`.
+
+    Raises ValueError if `address` is not a valid base58 public key.
+    """
+    return VerifyKey(bytes(Pubkey.from_string(address)))
 
-    @field_validator("issued_at", mode="before")
-    @classmethod
-    def ensure_tz(cls, v):
-        if isinstance(v, datetime):
-            return v if v.tzinfo else v.replace(tzinfo=UTC)
-        return v
+
+@dataclass(slots=True, frozen=True)
+class AuthMessage:
+    version: int
+    uri: str
+    issued_at: datetime  # timezone-aware
 
     def canonical_string(self) -> bytes:
-        lines = [
-            CANON_PREFIX,
-            f"version: {self.version}",
-            f"uri: {self.uri}",
-            f"issued-at: {iso_utc(self.issued_at)}",
-        ]
-        return ("\n".join(lines)).encode("utf-8")
+        return (
+            f"{CANON_PREFIX}\nversion: {self.version}\nuri: {self.uri}\nissued-at: {iso_utc(self.issued_at)}"
+        ).encode()
 
 
-class WirePayload(BaseModel):
+@dataclass(slots=True, frozen=True)
+class WirePayload:
     address: str
     msg: dict
     sig: str
@@ -66,25 +75,42 @@ def verify_solana_authorization_header(
     Returns the wallet address (base58) if verification passes.
     Raises AuthError on any failure.
     """
-    if not header_value.startswith("Solana "):
+    scheme_len = len(AUTH_SCHEME)
+    if header_value[:scheme_len] != AUTH_SCHEME:
         raise AuthError("Unsupported scheme")
 
+    encoded = header_value[scheme_len:]
+    if len(encoded) > MAX_PAYLOAD_LENGTH or not B64U_PAYLOAD_RE.fullmatch(encoded):
+        raise AuthError("Bad auth payload: not a base64url string")
+
+    # The payload has a fixed shape, so fields are checked by hand instead of running pydantic validation
     try:
-        payload = json.loads(b64u_decode(header_value.split(" ", 1)[1]))
-        wire = WirePayload(**payload)
+        payload = orjson.loads(b64u_decode(encoded))
+        address, msg_dict, sig = payload["address"], payload["msg"], payload["sig"]
+        if not (isinstance(address, str) and isinstance(msg_dict, dict) and isinstance(sig, str)):
+            raise TypeError("address and sig must be strings, msg an object")
+        wire = WirePayload(address=address, msg=msg_dict, sig=sig)
     except Exception as e:
         raise AuthError(f"Bad auth payload: {e}") from e
 
     try:
-        msg = AuthMessage(**wire.msg)
-    except ValidationError as e:
+        uri = msg_dict["uri"]
+        if not isinstance(uri, str):
+            raise TypeError("uri must be a string")
+        issued_at = datetime.fromisoformat(msg_dict["issuedAt"])
+        msg = AuthMessage(
+            version=int(msg_dict["v"]),
+            uri=uri,
+            issued_at=issued_at if issued_at.tzinfo else issued_at.replace(tzinfo=UTC),
+        )
+    except Exception as e:
         raise AuthError(f"Bad msg: {e}") from e
 
     if str(msg.uri) != request_uri:
         raise AuthError("URI mismatch")
 
     now = datetime.now(UTC)
-    issued = msg.issued_at if msg.issued_at.tzinfo else msg.issued_at.replace(tzinfo=UTC)
+    issued = msg.issued_at
 
     if issued - now > timedelta(seconds=clock_skew_seconds):
         raise AuthError("issued_at is in the future")
@@ -92,13 +118,13 @@ def verify_solana_authorization_header(
         raise AuthError("message expired")
 
     try:
-        pubkey = Pubkey.from_string(wire.address)
+        verify_key = verify_key_for(wire.address)
     except Exception as e:
         raise AuthError("Invalid address") from e
 
     canonical = msg.canonical_string()
     try:
-        VerifyKey(bytes(pubkey)).verify(canonical, b64u_decode(wire.sig))
+        verify_key.verify(canonical, b64u_decode(wire.sig))
     except (BadSignatureError, Exception) as e:
         raise AuthError("Signature verify failed") from e
 
@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Annotated
 
 from fastapi import Depends, Header, HTTPException, Request
@@ -33,6 +35,27 @@ async def get_user_address(
 UserAddressDep = Annotated[str, Depends(get_user_address)]
 
 
+@dataclass(slots=True)
+class SearchDeps:
+    """Services used by the paid retrieval endpoints, resolved together in one dependency."""
+
+    retrieval: RetrievalService
+    payment: X402PaymentHandler
+    purchase: PurchaseService
+
+
+async def get_search_deps(container: ContainerDep) -> SearchDeps:
+    return SearchDeps(
+        retrieval=await container.resolve(RetrievalService),
+        payment=await container.resolve(X402PaymentHandler),
+        purchase=await container.resolve(PurchaseService),
+    )
+
+
+SearchDepsDep = Annotated[SearchDeps, Depends(get_search_deps)]
+
+
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     return container.resolve_sync(Settings)
 
@@ -1,16 +1,27 @@
 import logging
+import sys
 
 import colorlog
 
 from x402_rag.core import Settings
 
+LOG_FORMAT = "[%(levelname)s]  %(asctime)s - %(name)s - %(message)s"
+LOG_DATEFMT = "%H:%M:%S"
+
+
+def _build_handler() -> logging.Handler:
+    # Colors only help a human reading a terminal; when logs go to a file or collector, the plain
+    # stdlib formatter skips colorlog's per-record escape-code handling
+    if not sys.stderr.isatty():
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATEFMT))
+        return handler
 
-def setup_logging(settings: Settings):
     handler = colorlog.StreamHandler()
     handler.setFormatter(
         colorlog.ColoredFormatter(
             "%(log_color)s[%(levelname)s]%(reset)s  %(asctime)s - %(name)s - %(message)s",
-            datefmt="%H:%M:%S",
+            datefmt=LOG_DATEFMT,
             log_colors={
                 "DEBUG": "cyan",
                 "INFO": "green",
@@ -20,10 +31,13 @@ def setup_logging(settings: Settings):
             },
         )
     )
+    return handler
 
+
+def setup_logging(settings: Settings):
     logging.basicConfig(
         level=getattr(logging, settings.log_level.upper()),
-        handlers=[handler],
+        handlers=[_build_handler()],
     )
 
     app_log_level = getattr(logging, settings.app_log_level.upper())
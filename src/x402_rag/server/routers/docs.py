@@ -1,21 +1,25 @@
+import asyncio
 import logging
 
 from fastapi import APIRouter, HTTPException, Request, Response
 
-from x402_rag.services import DocIndexService, PurchaseService, RetrievalService, WebIndexService
+from x402_rag.services import DocIndexService, WebIndexService
 from x402_rag.services.schemas import (
+    DocumentChunk,
     FetchChunksByRangeRequest,
     FetchChunksByRangeResult,
     IndexDocsRequest,
     IndexResult,
     IndexWebPagesRequest,
+    SearchBatchRequest,
+    SearchBatchResult,
     SearchRequest,
     SearchResult,
 )
 from x402_rag.services.utils import stable_chunk_uuid
 
-from ..dependencies import ContainerDep, UserAddressDep
-from ..x402 import X402PaymentHandler, X402PaymentRequired
+from ..dependencies import ContainerDep, SearchDeps, SearchDepsDep, UserAddressDep
+from ..x402 import X402PaymentRequired
 
 logger = logging.getLogger(__name__)
 
@@ -32,11 +36,11 @@ async def index_docs(
 ) -> IndexResult:
     """Index documents from file paths."""
     try:
-        logger.debug(f"User {user_address} indexing documents")
+        logger.debug("User %s indexing documents", user_address)
         doc_index_service = await container.resolve(DocIndexService)
         return await doc_index_service.index_docs(params.documents)
-    except Exception as e:
-        logger.exception(f"Failed to index documents: {str(e)}")
+    except Exception:
+        logger.exception("Failed to index documents")
         raise HTTPException(status_code=500, detail="Failed to index documents!") from None
 
 
@@ -48,20 +52,113 @@ async def index_web_pages(
 ) -> IndexResult:
     """Index web pages from URLs."""
     try:
-        logger.debug(f"User {user_address} indexing web pages")
+        logger.debug("User %s indexing web pages", user_address)
         web_index_service = await container.resolve(WebIndexService)
         return await web_index_service.index_web_pages(params.pages)
-    except Exception as e:
-        logger.exception(f"Failed to index web pages: {str(e)}")
+    except Exception:
+        logger.exception("Failed to index web pages")
         raise HTTPException(status_code=500, detail="Failed to index web pages!") from None
 
 
+async def _charge_for_chunks(
+    chunks: list[DocumentChunk],
+    *,
+    request: Request,
+    response: Response,
+    deps: SearchDeps,
+    user_address: str,
+    description: str,
+    log_tag: str,
+) -> None:
+    """Charge the user for the chunks they haven't paid for yet and record the purchase.
+
+    Raises:
+        X402PaymentRequired: If payment is missing, invalid, or fails to settle
+    """
+    # With payments disabled nothing is charged or recorded, so skip the purchase lookup too
+    if not deps.payment.settings.x402.enabled:
+        return
+
+    # Filter out chunks that user has already paid for
+    unpaid_chunks, paid_chunks = await deps.purchase.filter_unpaid_chunks(
+        user_address=user_address,
+        chunks=chunks,
+    )
+
+    # Price and purchase ids of the unpaid chunks in one pass
+    total_price = 0
+    unpaid_chunk_ids = []
+    for chunk in unpaid_chunks:
+        total_price += chunk.metadata.price
+        unpaid_chunk_ids.append(stable_chunk_uuid(chunk.metadata.doc_id, chunk.metadata.chunk_id))
+
+    if total_price == 0:
+        logger.info("[%s] All %d chunks are already paid, skipping payment", log_tag, len(chunks))
+        return
+
+    # %-style arguments, so the message is only formatted when debug logging is enabled
+    logger.debug(
+        "[%s] %s by User %s\n\tTotal chunks: %d\n\tUnpaid chunks: %d\n\tPaid chunks: %d"
+        "\n\tUnpaid price: %d USDC base units",
+        log_tag,
+        description,
+        user_address,
+        len(chunks),
+        len(unpaid_chunks),
+        len(paid_chunks),
+        total_price,
+    )
+
+    payment_ctx = await deps.payment.verify_payment(
+        request=request,
+        total_price=total_price,
+        description=description,
+    )
+
+    await deps.payment.settle_payment(payment_ctx, response)
+
+    # Record the purchase for unpaid chunks
+    await deps.purchase.record_purchases(user_address, unpaid_chunk_ids)
+
+
+async def _paid_search(
+    params: SearchRequest,
+    request: Request,
+    response: Response,
+    deps: SearchDeps,
+    user_address: str,
+) -> SearchResult:
+    """Run a search and charge the user for the unpaid chunks in the result.
+
+    Raises:
+        X402PaymentRequired: If payment is missing, invalid, or fails to settle
+    """
+    result = await deps.retrieval.search(
+        query=params.query,
+        k=params.k,
+        filters=params.filters,
+    )
+
+    if result.chunks:
+        await _charge_for_chunks(
+            result.chunks,
+            request=request,
+            response=response,
+            deps=deps,
+            user_address=user_address,
+            description=f"Searching documents for query: {params.query[:50]}...",
+            log_tag="SEARCH",
+        )
+
+    return result
+
+
 @router.post("/docs/search")
 async def search_docs(
     params: SearchRequest,
     request: Request,
     response: Response,
-    container: ContainerDep,
+    deps: SearchDepsDep,
     user_address: UserAddressDep,
 ) -> SearchResult:
     """Search for documents similar to the query text.
@@ -69,127 +166,104 @@ async def search_docs(
     Requires payment based on number of chunks retrieved.
     """
     try:
-        retrieval_service = await container.resolve(RetrievalService)
-        payment_handler = await container.resolve(X402PaymentHandler)
-        purchase_service = await container.resolve(PurchaseService)
-
-        result = await retrieval_service.search(
-            query=params.query,
-            k=params.k,
-            filters=params.filters,
-        )
-
-        if not result.chunks:
-            return result
+        return await _paid_search(params, request, response, deps, user_address)
+    except X402PaymentRequired as e:
+        return e.response
+    except Exception:
+        logger.exception("Failed to search documents")
+        raise HTTPException(status_code=500, detail="Failed to search documents!") from None
 
-        # Filter out chunks that user has already paid for
-        unpaid_chunks, paid_chunks = await purchase_service.filter_unpaid_chunks(
-            user_address=user_address,
-            chunks=result.chunks,
-        )
 
-        total_price = sum([chunk.metadata.price for chunk in unpaid_chunks])
-        if total_price == 0:
-            logger.info(f"[SEARCH] All {len(result.chunks)} chunks are already paid, skipping payment")
-            return result
-
-        logger.debug(
-            f"Search request by User {user_address}"
-            f"\n\tTotal chunks: {result.total}"
-            f"\n\tUnpaid chunks: {len(unpaid_chunks)}"
-            f"\n\tPaid chunks: {len(paid_chunks)}"
-            f"\n\tUnpaid price: {total_price} USDC base units"
-        )
+@router.post("/docs/search/batch")
+async def search_docs_batch(
+    params: SearchBatchRequest,
+    request: Request,
+    response: Response,
+    deps: SearchDepsDep,
+    user_address: UserAddressDep,
+) -> SearchBatchResult:
+    """Run several searches in one request with a single payment.
 
-        description = f"Searching documents for query: {params.query[:50]}..."
-        payment_ctx = await payment_handler.verify_payment(
-            request=request,
-            total_price=total_price,
-            description=description,
+    A chunk returned by more than one query is charged once.
+    """
+    try:
+        results = await asyncio.gather(
+            *[deps.retrieval.search(query=q.query, k=q.k, filters=q.filters) for q in params.queries]
         )
 
-        await payment_handler.settle_payment(payment_ctx, response)
-
-        # Record the purchase for unpaid chunks
-        unpaid_chunk_ids = [
-            stable_chunk_uuid(chunk.metadata.doc_id, chunk.metadata.chunk_id) for chunk in unpaid_chunks
-        ]
-        await purchase_service.record_purchases(user_address, unpaid_chunk_ids)
-
-        return result
+        # Deduplicate chunks across queries so each is paid for once
+        unique_chunks = {
+            (chunk.metadata.doc_id, chunk.metadata.chunk_id): chunk for result in results for chunk in result.chunks
+        }
+        if unique_chunks:
+            await _charge_for_chunks(
+                list(unique_chunks.values()),
+                request=request,
+                response=response,
+                deps=deps,
+                user_address=user_address,
+                description=f"Searching documents for {len(params.queries)} queries",
+                log_tag="SEARCH_BATCH",
+            )
+
+        return SearchBatchResult(results=results)
 
     except X402PaymentRequired as e:
         return e.response
-    except Exception as e:
-        logger.exception(f"Failed to search documents: {str(e)}")
+    except Exception:
+        logger.exception("Failed to search documents")
         raise HTTPException(status_code=500, detail="Failed to search documents!") from None
 
 
-@router.post("/docs/chunks")
-async def get_chunk_range(
+async def _paid_chunk_range(
     params: FetchChunksByRangeRequest,
     request: Request,
     response: Response,
-    container: ContainerDep,
-    user_address: UserAddressDep,
+    deps: SearchDeps,
+    user_address: str,
 ) -> FetchChunksByRangeResult:
-    """Fetch a range of chunks for a specific document.
+    """Fetch a chunk range and charge the user for the unpaid chunks in it.
 
-    Requires payment based on number of chunks retrieved.
+    Raises:
+        X402PaymentRequired: If payment is missing, invalid, or fails to settle
     """
-    try:
-        retrieval_service = await container.resolve(RetrievalService)
-        payment_handler = await container.resolve(X402PaymentHandler)
-        purchase_service = await container.resolve(PurchaseService)
-
-        result = await retrieval_service.get_chunk_range(
-            doc_id=params.doc_id,
-            start_chunk=params.start_chunk,
-            end_chunk=params.end_chunk,
-        )
-
-        if not result.chunks:
-            return result
-
-        # Filter out chunks that user has already paid for
-        unpaid_chunks, paid_chunks = await purchase_service.filter_unpaid_chunks(
-            user_address=user_address,
-            chunks=result.chunks,
-        )
-
-        total_price = sum([chunk.metadata.price for chunk in unpaid_chunks])
-        if total_price == 0:
-            logger.info(f"[CHUNKS] All {len(result.chunks)} chunks are already paid, skipping payment")
-            return result
+    result = await deps.retrieval.get_chunk_range(
+        doc_id=params.doc_id,
+        start_chunk=params.start_chunk,
+        end_chunk=params.end_chunk,
+    )
 
+    if result.chunks:
         end_chunk = params.end_chunk or params.start_chunk
-        logger.debug(
-            f"Fetch chunks request by User {user_address} for document {params.doc_id}"
-            f"\n\tTotal chunks: {result.total}"
-            f"\n\tUnpaid chunks: {len(unpaid_chunks)}"
-            f"\n\tPaid chunks: {len(paid_chunks)}"
-            f"\n\tUnpaid price: {total_price} USDC base units"
-        )
-
-        description = f"Fetching chunks for document {params.doc_id} from chunk {params.start_chunk} to {end_chunk}"
-        payment_ctx = await payment_handler.verify_payment(
+        await _charge_for_chunks(
+            result.chunks,
             request=request,
-            total_price=total_price,
-            description=description,
+            response=response,
+            deps=deps,
+            user_address=user_address,
+            description=f"Fetching chunks for document {params.doc_id} from chunk {params.start_chunk} to {end_chunk}",
+            log_tag="CHUNKS",
         )
 
-        await payment_handler.settle_payment(payment_ctx, response)
+    return result
 
-        # Record the purchase for unpaid chunks
-        unpaid_chunk_ids = [
-            stable_chunk_uuid(chunk.metadata.doc_id, chunk.metadata.chunk_id) for chunk in unpaid_chunks
-        ]
-        await purchase_service.record_purchases(user_address, unpaid_chunk_ids)
 
-        return result
+@router.post("/docs/chunks")
+async def get_chunk_range(
+    params: FetchChunksByRangeRequest,
+    request: Request,
+    response: Response,
+    deps: SearchDepsDep,
+    user_address: UserAddressDep,
+) -> FetchChunksByRangeResult:
+    """Fetch a range of chunks for a specific document.
 
+    Requires payment based on number of chunks retrieved.
+    """
+    try:
+        return await _paid_chunk_range(params, request, response, deps, user_address)
     except X402PaymentRequired as e:
         return e.response
-    except Exception as e:
-        logger.exception(f"Failed to fetch chunks: {str(e)}")
+    except Exception:
+        logger.exception("Failed to fetch chunks")
         raise HTTPException(status_code=500, detail="Failed to fetch chunks!") from None
@@ -3,26 +3,68 @@ from contextlib import asynccontextmanager
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from x402_rag.core import RuntimeContext
+from x402_rag.services import DocIndexService, PurchaseService, RetrievalService, WebIndexService
+from x402_rag.services.loaders import shutdown_pdf_pool
 
 from .dependencies import get_settings
 from .logging import setup_logging
 from .routers import docs
 from .simple_di import container
+from .x402 import X402PaymentHandler
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Runs in every worker process, which (unlike the single-process case) don't go through bootstrap
+    setup_logging(get_settings())
+
     await container.resolve(RuntimeContext)
+    # Build the rest of the singletons now, so the first requests don't pay for it (and a broken
+    # configuration fails startup instead of a request)
+    for service in (X402PaymentHandler, PurchaseService, RetrievalService, DocIndexService, WebIndexService):
+        await container.resolve(service)
     yield
 
+    await (await container.resolve(X402PaymentHandler)).close()
+    await (await container.resolve(WebIndexService)).close()
+    shutdown_pdf_pool()
+
+
+class NDJSONAwareGZipMiddleware(GZipMiddleware):
+    """GZip responses, except NDJSON streams.
+
+    Starlette's compressor holds streamed lines back until it has a full block to emit, and only
+    exempts `text/event-stream`. NDJSON responses are marked as already encoded, which starlette
+    passes through untouched, so each line reaches the client as soon as it is produced.
+    """
+
+    def __init__(self, app: ASGIApp, **kwargs):
+        async def mark_ndjson(scope: Scope, receive: Receive, send: Send) -> None:
+            async def send_marked(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(raw=message["headers"])
+                    if headers.get("content-type", "").startswith("application/x-ndjson"):
+                        headers.setdefault("content-encoding", "identity")
+                await send(message)
+
+            await app(scope, receive, send_marked)
+
+        super().__init__(mark_ndjson, **kwargs)
+
 
 app = FastAPI(
     title="X402 RAG Server",
     description="FastAPI server exposing the X402 RAG API",
     version="0.0.1",
     lifespan=lifespan,
+    # Search and chunk responses carry many chunks; orjson encodes them much faster than stdlib json
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -33,6 +75,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Chunk text compresses well; clients asking for gzip (httpx does by default) get much smaller
+# search and chunk responses. Small bodies like health checks aren't worth compressing.
+app.add_middleware(NDJSONAwareGZipMiddleware, minimum_size=1000)
+
 app.include_router(docs.router)
 
 
@@ -47,10 +93,13 @@ def bootstrap():
     settings = get_settings()
     setup_logging(settings)
 
+    # The loop and HTTP parser are left on "auto", which picks uvloop and httptools (installed with
+    # uvicorn[standard]) where they're available
     uvicorn.run(
         "x402_rag.server.run:app",
         host=settings.server_host,
         port=settings.server_port,
+        workers=settings.server_workers,
     )
 
 
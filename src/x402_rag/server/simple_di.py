@@ -5,6 +5,9 @@ from typing import Any
 # Gets resolved dependencies as variable arguments and returns a provider
 type ProviderResolver[T] = Callable[..., T | Coroutine[Any, Any, T]]
 
+# Marks a provider that hasn't been resolved yet (None is a valid provider)
+_MISSING = object()
+
 
 @dataclass
 class ProviderFactory[T]:
@@ -33,8 +36,10 @@ class DiContainer:
         )
 
     def resolve_sync[T](self, target_type: type[T]) -> T:
-        if target_type in self.providers:
-            return self.providers[target_type]
+        # Single dict lookup on the hot path, where the provider has already been resolved
+        provider = self.providers.get(target_type, _MISSING)
+        if provider is not _MISSING:
+            return provider
 
         if target_type not in self.factories:
             raise ValueError(f"No factory registered for {target_type}")
@@ -51,8 +56,9 @@ class DiContainer:
         return provider
 
     async def resolve[T](self, target_type: type[T]) -> T:
-        if target_type in self.providers:
-            return self.providers[target_type]
+        provider = self.providers.get(target_type, _MISSING)
+        if provider is not _MISSING:
+            return provider
 
         if target_type not in self.factories:
             raise ValueError(f"No factory registered for {target_type}")
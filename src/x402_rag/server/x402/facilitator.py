@@ -69,6 +69,20 @@ class FacilitatorClient:
             url = url[:-1]
 
         self.config = {"url": url, "create_headers": config.get("create_headers")}
+        # One client for the lifetime of the facilitator, so calls reuse kept-alive connections
+        # instead of paying a TCP/TLS handshake each
+        self._http: httpx.AsyncClient | None = None
+
+    def _client(self) -> httpx.AsyncClient:
+        if self._http is None:
+            self._http = httpx.AsyncClient(limits=httpx.Limits(max_keepalive_connections=50))
+        return self._http
+
+    async def close(self) -> None:
+        """Close the pooled connections to the facilitator."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     async def verify(self, payment: PaymentPayload, payment_requirements: PaymentRequirements) -> VerifyResponse:
         """Verify a payment header is valid and a request should be processed"""
@@ -78,20 +92,20 @@ class FacilitatorClient:
             custom_headers = await self.config["create_headers"]()
             headers.update(custom_headers.get("verify", {}))
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.config['url']}/verify",
-                json={
-                    "x402Version": payment.x402_version,
-                    "paymentPayload": payment.model_dump(by_alias=True),
-                    "paymentRequirements": payment_requirements.model_dump(by_alias=True, exclude_none=True),
-                },
-                headers=headers,
-                follow_redirects=True,
-            )
-
-            data = response.json()
-            return VerifyResponse(**data)
+        client = self._client()
+        response = await client.post(
+            f"{self.config['url']}/verify",
+            json={
+                "x402Version": payment.x402_version,
+                "paymentPayload": payment.model_dump(by_alias=True),
+                "paymentRequirements": payment_requirements.model_dump(by_alias=True, exclude_none=True),
+            },
+            headers=headers,
+            follow_redirects=True,
+        )
+
+        data = response.json()
+        return VerifyResponse(**data)
 
     async def settle(self, payment: PaymentPayload, payment_requirements: PaymentRequirements) -> SettleResponse:
         headers = {"Content-Type": "application/json"}
@@ -100,19 +114,19 @@ class FacilitatorClient:
             custom_headers = await self.config["create_headers"]()
             headers.update(custom_headers.get("settle", {}))
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.config['url']}/settle",
-                json={
-                    "x402Version": payment.x402_version,
-                    "paymentPayload": payment.model_dump(by_alias=True),
-                    "paymentRequirements": payment_requirements.model_dump(by_alias=True, exclude_none=True),
-                },
-                headers=headers,
-                follow_redirects=True,
-            )
-            data = response.json()
-            return SettleResponse(**data)
+        client = self._client()
+        response = await client.post(
+            f"{self.config['url']}/settle",
+            json={
+                "x402Version": payment.x402_version,
+                "paymentPayload": payment.model_dump(by_alias=True),
+                "paymentRequirements": payment_requirements.model_dump(by_alias=True, exclude_none=True),
+            },
+            headers=headers,
+            follow_redirects=True,
+        )
+        data = response.json()
+        return SettleResponse(**data)
 
     async def list(self, request: ListDiscoveryResourcesRequest | None = None) -> ListDiscoveryResourcesResponse:
         """List discovery resources from the facilitator service.
@@ -135,16 +149,16 @@ class FacilitatorClient:
         # Build query parameters, excluding None values
         params = {k: str(v) for k, v in request.model_dump(by_alias=True).items() if v is not None}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.config['url']}/discovery/resources",
-                params=params,
-                headers=headers,
-                follow_redirects=True,
-            )
+        client = self._client()
+        response = await client.get(
+            f"{self.config['url']}/discovery/resources",
+            params=params,
+            headers=headers,
+            follow_redirects=True,
+        )
 
-            if response.status_code != 200:
-                raise ValueError(f"Failed to list discovery resources: {response.status_code} {response.text}")
+        if response.status_code != 200:
+            raise ValueError(f"Failed to list discovery resources: {response.status_code} {response.text}")
 
-            data = response.json()
-            return ListDiscoveryResourcesResponse(**data)
+        data = response.json()
+        return ListDiscoveryResourcesResponse(**data)
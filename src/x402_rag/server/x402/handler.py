@@ -1,31 +1,41 @@
-import base64
-import json
+import asyncio
 import logging
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import cast
 
+import orjson
+import pybase64
 from fastapi import Request, Response
 from fastapi.responses import HTMLResponse, JSONResponse
+from pydantic import TypeAdapter
 
 from x402.common import (
     find_matching_payment_requirements,
     x402_VERSION,
 )
-from x402.encoding import safe_base64_decode
-from x402.paywall import get_paywall_html, is_browser_request
+from x402.paywall import get_paywall_html
 from x402.types import (
     PaywallConfig,
     x402PaymentRequiredResponse,
 )
 from x402_rag.core import Settings, SupportedNetworks
 
-from .facilitator import FacilitatorClient, FacilitatorConfig
+from .facilitator import FacilitatorClient, FacilitatorConfig, SettleResponse, VerifyResponse
 from .schemas import PaymentPayload, PaymentRequirements
 
 logger = logging.getLogger(__name__)
 
+# Each rendered paywall page embeds the ~2.8MB x402 template, so only a few are kept
+PAYWALL_CACHE_SIZE = 8
 
-@dataclass
+# Serializes straight to bytes for the X-PAYMENT-RESPONSE header, unlike model_dump_json
+_SETTLE_RESPONSE_ADAPTER = TypeAdapter(SettleResponse)
+
+
+@dataclass(slots=True)
 class PaymentContext:
     """Context object holding payment verification state."""
 
@@ -61,6 +71,27 @@ class X402PaymentHandler:
         self.settings = settings
         self.facilitator = FacilitatorClient(FacilitatorConfig(url=settings.x402.facilitator_url))
         self.paywall_config = paywall_config
+        # Rendering the paywall takes a few ms; browsers reloading the same 402 page get a cached copy
+        self._paywall_html = lru_cache(maxsize=PAYWALL_CACHE_SIZE)(self._render_paywall_html)
+        # Requirement fields that only depend on settings, validated once here
+        self._requirements_template = PaymentRequirements(
+            scheme="exact",
+            network=cast(SupportedNetworks, settings.x402.network),
+            asset=settings.x402.usdc_address,
+            max_amount_required="0",
+            resource="",
+            description="",
+            mime_type="application/json",
+            pay_to=settings.x402.pay_to_address,
+            max_timeout_seconds=60,
+            extra={
+                "feePayer": settings.x402.fee_payer,
+            },
+        )
+        # (transaction, resource, amount) -> (expires at, verification), oldest first
+        self._verify_cache: OrderedDict[tuple[str, str, str], tuple[float, asyncio.Future[VerifyResponse]]] = (
+            OrderedDict()
+        )
 
     def create_payment_requirements(
         self,
@@ -83,22 +114,26 @@ class X402PaymentHandler:
         Returns:
             PaymentRequirements object
         """
-
-        return PaymentRequirements(
-            scheme="exact",
-            network=cast(SupportedNetworks, self.settings.x402.network),
-            asset=self.settings.x402.usdc_address,
-            max_amount_required=str(total_price),
-            resource=resource,
-            description=description,
-            mime_type=mime_type,
-            pay_to=self.settings.x402.pay_to_address,
-            max_timeout_seconds=max_timeout_seconds,
-            extra={
-                "feePayer": self.settings.x402.fee_payer,
-            },
+        # Copy the template with the per-request values, which are all typed by the signature
+        return self._requirements_template.model_copy(
+            update={
+                "max_amount_required": str(total_price),
+                "resource": resource,
+                "description": description,
+                "mime_type": mime_type,
+                "max_timeout_seconds": max_timeout_seconds,
+            }
         )
 
+    async def close(self) -> None:
+        """Release the facilitator's connections."""
+        await self.facilitator.close()
+
+    def _render_paywall_html(self, error: str, requirements_json: str) -> str:
+        # Requirements come in as JSON so they can be part of the cache key
+        requirements = PaymentRequirements.model_validate_json(requirements_json)
+        return get_paywall_html(error, [requirements], self.paywall_config)
+
     def _create_402_response(
         self,
         error: str,
@@ -106,10 +141,11 @@ class X402PaymentHandler:
         request: Request,
     ) -> JSONResponse | HTMLResponse:
         """Create a 402 Payment Required response."""
-        request_headers = dict(request.headers)
-
-        if is_browser_request(request_headers):
-            html_content = get_paywall_html(error, [payment_requirements], self.paywall_config)
+        # Same check as x402's is_browser_request, reading the two headers directly (Starlette header
+        # lookups are already case-insensitive) instead of copying all of them into a lowercased dict
+        headers = request.headers
+        if "text/html" in headers.get("accept", "") and "Mozilla" in headers.get("user-agent", ""):
+            html_content = self._paywall_html(error, payment_requirements.model_dump_json())
             return HTMLResponse(
                 content=html_content,
                 status_code=402,
@@ -147,9 +183,9 @@ class X402PaymentHandler:
         Raises:
             X402PaymentRequired: If payment is missing, invalid, or insufficient
         """
-        # Skip payment check if x402 is disabled
-        if not self.settings.x402.enabled:
-            # Return a dummy context when payments are disabled
+        # Skip payment check if x402 is disabled or there is nothing to pay for
+        if not self.settings.x402.enabled or total_price <= 0:
+            # Return a dummy context when no payment is needed
             return PaymentContext(
                 payment=None,
                 requirements=None,
@@ -173,7 +209,8 @@ class X402PaymentHandler:
 
         # Decode payment header
         try:
-            payment_dict = json.loads(safe_base64_decode(payment_header))
+            # Same lenient decoding as x402's safe_base64_decode, on pybase64's SIMD codec
+            payment_dict = orjson.loads(pybase64.b64decode(payment_header, validate=False))
             payment = PaymentPayload(**payment_dict)
         except Exception as e:
             client_host = request.client.host if request.client else "unknown"
@@ -190,7 +227,7 @@ class X402PaymentHandler:
 
         # Verify payment with facilitator
         try:
-            verify_response = await self.facilitator.verify(payment, payment_requirements)
+            verify_response = await self._verify(payment, payment_requirements)
         except Exception as e:
             logger.error(f"Failed to verify payment: {e}")
             raise X402PaymentRequired(
@@ -220,6 +257,47 @@ class X402PaymentHandler:
             is_verified=True,
         )
 
+    async def _verify(self, payment: PaymentPayload, requirements: PaymentRequirements) -> VerifyResponse:
+        """Verify a payment with the facilitator, reusing a recent successful verification of the same payment.
+
+        Requests carrying the same payment for the same resource and amount (client retries, concurrent
+        duplicates) share one facilitator call. Settlement still runs for every request, so a reused
+        verification never lets a payment be spent twice.
+        """
+        ttl = self.settings.x402.verify_cache_ttl
+        if ttl <= 0:
+            return await self.facilitator.verify(payment, requirements)
+
+        key = (payment.payload.transaction, requirements.resource, requirements.max_amount_required)
+        now = time.monotonic()
+        entry = self._verify_cache.get(key)
+        if entry is not None and entry[0] > now:
+            self._verify_cache.move_to_end(key)
+            return await asyncio.shield(entry[1])
+
+        # The call runs as its own task so a cancelled request doesn't cancel it for the others waiting on it
+        task = asyncio.ensure_future(self.facilitator.verify(payment, requirements))
+        self._verify_cache[key] = (now + ttl, task)
+        self._verify_cache.move_to_end(key)
+        while len(self._verify_cache) > self.settings.x402.verify_cache_size:
+            self._verify_cache.popitem(last=False)
+
+        try:
+            verify_response = await asyncio.shield(task)
+        except Exception:
+            self._forget_verification(key, task)
+            raise
+
+        # Only successes are reused; a failed payment may become valid (e.g. once the payer is funded)
+        if not verify_response.is_valid:
+            self._forget_verification(key, task)
+        return verify_response
+
+    def _forget_verification(self, key: tuple[str, str, str], task: asyncio.Future[VerifyResponse]) -> None:
+        entry = self._verify_cache.get(key)
+        if entry is not None and entry[1] is task:
+            del self._verify_cache[key]
+
     async def settle_payment(self, payment_ctx: PaymentContext, response: Response) -> None:
         """
         Settle a verified payment and set the X-PAYMENT-RESPONSE header.
@@ -239,8 +317,8 @@ class X402PaymentHandler:
             settle_response = await payment_ctx.facilitator.settle(payment_ctx.payment, payment_ctx.requirements)
 
             if settle_response.success:
-                json_data = settle_response.model_dump_json(by_alias=True)
-                settlement_header = base64.b64encode(json_data.encode("utf-8")).decode("utf-8")
+                json_data = _SETTLE_RESPONSE_ADAPTER.dump_json(settle_response, by_alias=True)
+                settlement_header = pybase64.b64encode_as_string(json_data)
                 response.headers["X-PAYMENT-RESPONSE"] = settlement_header
                 return
 
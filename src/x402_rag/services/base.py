@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 from langchain_core.documents import Document
@@ -22,8 +23,16 @@ class BaseIndexService:
         self.doc_store = doc_store
         self.text_splitter = text_splitter
         self.settings = settings
+        # Bounds the batches in flight across all indexing calls, so they can't drain the DB pool
+        self._index_slots = asyncio.Semaphore(settings.index_concurrency)
 
-    async def index_document(self, source: str, content: str, price_usd: float, doc_type: str):
+    def build_document_chunks(
+        self, source: str, content: str, price_usd: float, doc_type: str
+    ) -> tuple[IndexedDocument, list[Document], list[str]] | None:
+        """Split a document into priced chunks ready to be added to the store, with their ids.
+
+        Returns None if the document has no content to index.
+        """
         doc_id = build_doc_id(source)
 
         logger.debug(f"Indexing document {source} with content length {len(content)}")
@@ -38,8 +47,8 @@ class BaseIndexService:
         total_chars = sum(len(chunk) for chunk in chunks)
 
         usdc_decimals = self.settings.x402.usdc_decimals
-        # Convert USD price to USDC base units
-        price_base_units = int(price_usd * (10**usdc_decimals))
+        # Convert USD price to USDC base units; rounded, since e.g. 2.01 * 10**6 is 2009999.99... as a float
+        price_base_units = round(price_usd * (10**usdc_decimals))
 
         chunks_to_index: list[Document] = []
         chunk_ids: list[str] = []
@@ -49,7 +58,7 @@ class BaseIndexService:
 
             # Calculate chunk price based on character proportion
             chunk_chars = len(text)
-            chunk_price = int((chunk_chars / total_chars) * price_base_units) if total_chars > 0 else 0
+            chunk_price = chunk_chars * price_base_units // total_chars if total_chars > 0 else 0
 
             metadata: DocumentChunkMetadata = {
                 "source": source,
@@ -61,10 +70,26 @@ class BaseIndexService:
             chunks_to_index.append(Document(page_content=text, metadata=metadata))
             chunk_ids.append(chunk_id)
 
-        await self.doc_store.aadd_documents(documents=chunks_to_index, ids=chunk_ids)
-
-        return IndexedDocument(
+        indexed_document = IndexedDocument(
             doc_id=doc_id,
             source=source,
             chunks_count=len(chunks_to_index),
         )
+        return indexed_document, chunks_to_index, chunk_ids
+
+    async def add_document_chunks(self, documents: list[Document], ids: list[str]) -> None:
+        """Add the chunks of several documents to the store in batches of `index_batch_size`.
+
+        Up to `index_concurrency` batches are embedded and inserted at once, so one huge embedding
+        request doesn't stall the whole indexing call, while the connection pool and the embedding
+        provider's rate limits are respected.
+        """
+        batch_size = self.settings.index_batch_size
+        async with asyncio.TaskGroup() as tg:
+            for start in range(0, len(documents), batch_size):
+                end = start + batch_size
+                tg.create_task(self._add_batch(documents[start:end], ids[start:end]))
+
+    async def _add_batch(self, documents: list[Document], ids: list[str]) -> None:
+        async with self._index_slots:
+            await self.doc_store.aadd_documents(documents=documents, ids=ids)
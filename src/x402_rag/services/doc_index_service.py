@@ -1,6 +1,8 @@
 import asyncio
 import logging
 
+from langchain_core.documents import Document
+
 from x402_rag.core import RuntimeContext
 
 from .base import BaseIndexService
@@ -25,25 +27,47 @@ class DocIndexService(BaseIndexService):
         """
         Index documents from file paths.
         """
+        # A path listed more than once is indexed once, with its last price, as it would have ended up
+        # when each entry overwrote the previous one; it also can't appear twice in the single store insert
+        documents_to_index = list({doc.path: doc for doc in documents_to_index}.values())
+
         paths = [doc.path for doc in documents_to_index]
-        md_list = await asyncio.gather(*[parse_pdf_to_markdown(p) for p in paths])
+        # Parsing is capped at one PDF per core by the process pool; the task group cancels the
+        # parses still queued there as soon as one fails
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(parse_pdf_to_markdown(p)) for p in paths]
+        md_list = [task.result() for task in tasks]
 
         logger.debug(f"Parsed {len(md_list)}/{len(paths)} documents")
 
         indexed_documents: list[IndexedDocument] = []
+        all_chunks: list[Document] = []
+        all_chunk_ids: list[str] = []
         for doc_to_index, markdown_text in zip(documents_to_index, md_list, strict=True):
             path = doc_to_index.path
             price_usd = doc_to_index.price_usd
 
-            doc = await self.index_document(
+            # Splitting a large document takes a while; a worker thread keeps the event loop responsive meanwhile
+            built = await asyncio.to_thread(
+                self.build_document_chunks,
                 source=path,
                 content=markdown_text,
                 price_usd=price_usd,
                 doc_type="pdf",
             )
+            if built is None:
+                continue
+
+            doc, chunks, chunk_ids = built
             indexed_documents.append(doc)
+            all_chunks.extend(chunks)
+            all_chunk_ids.extend(chunk_ids)
+
+            logger.debug(f"Prepared {doc.chunks_count} chunks for document {path} with price ${price_usd}")
 
-            logger.debug(f"Indexed {doc.chunks_count} chunks for document {path} with price ${price_usd}")
+        # Chunks of all documents are added together, so the embedding requests and inserts are batched across documents
+        await self.add_document_chunks(all_chunks, all_chunk_ids)
+        logger.debug(f"Indexed {len(all_chunks)} chunks from {len(indexed_documents)} documents")
 
         return IndexResult(
             indexed_documents=indexed_documents,
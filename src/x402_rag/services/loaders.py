@@ -1,9 +1,13 @@
 """Document loaders for PDFs and web pages."""
 
 import asyncio
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 
+import httpx
 import pymupdf4llm
-from langchain_community.document_loaders import AsyncHtmlLoader
 from langchain_community.document_loaders.chromium import AsyncChromiumLoader
 from langchain_core.documents import Document
 
@@ -11,20 +15,79 @@ from x402_rag.core import Settings
 
 from .utils import looks_like_spa
 
+# Created on first use, so processes that never parse a PDF don't start one
+_pdf_pool: ProcessPoolExecutor | None = None
+
+# Markdown of recently parsed PDFs by (path, size, mtime), so re-indexing an unchanged file skips the parse
+PDF_CACHE_SIZE = 32
+_pdf_cache: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+
+# Browser-like request headers, the ones LangChain's AsyncHtmlLoader sends
+WEB_HEADERS = {
+    "User-Agent": os.environ.get("USER_AGENT", "DefaultLangchainUserAgent"),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Referer": "https://www.google.com/",
+    "DNT": "1",
+    "Upgrade-Insecure-Requests": "1",
+}
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    global _pdf_pool
+    if _pdf_pool is None:
+        # Spawned rather than forked: the server process has an event loop, DB connections and threads
+        _pdf_pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+    return _pdf_pool
+
+
+def shutdown_pdf_pool() -> None:
+    """Stop the PDF parsing processes, if they were started."""
+    global _pdf_pool
+    if _pdf_pool is not None:
+        _pdf_pool.shutdown(cancel_futures=True)
+        _pdf_pool = None
+
 
 async def parse_pdf_to_markdown(path: str) -> str:
     """
     Parse a PDF file to markdown format.
-    CPU-bound operation run in a worker thread.
+    CPU-bound operation run in a worker process, so several PDFs are parsed in parallel
+    instead of taking turns on the GIL.
     """
-    return await asyncio.to_thread(pymupdf4llm.to_markdown, path)
+    st = os.stat(path)
+    key = (path, st.st_size, st.st_mtime_ns)
+    markdown = _pdf_cache.get(key)
+    if markdown is not None:
+        _pdf_cache.move_to_end(key)
+        return markdown
 
+    loop = asyncio.get_running_loop()
+    markdown = await loop.run_in_executor(_get_pdf_pool(), pymupdf4llm.to_markdown, path)
 
-async def load_url_static(url: str) -> list[Document]:
+    _pdf_cache[key] = markdown
+    if len(_pdf_cache) > PDF_CACHE_SIZE:
+        _pdf_cache.popitem(last=False)
+    return markdown
+
+
+def create_web_client() -> httpx.AsyncClient:
+    """Create an HTTP client for loading web pages; share it between loads to reuse connections."""
+    # Failed connection attempts are retried, like AsyncHtmlLoader does
+    transport = httpx.AsyncHTTPTransport(
+        retries=2, limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+    )
+    return httpx.AsyncClient(headers=WEB_HEADERS, timeout=30.0, follow_redirects=True, transport=transport)
+
+
+async def load_url_static(url: str, client: httpx.AsyncClient | None = None) -> list[Document]:
     """Load URL content using static HTML parsing."""
-    loader = AsyncHtmlLoader(web_path=[url])
-    docs = await loader.aload()
-    return docs or []
+    if client is None:
+        async with create_web_client() as client:
+            return await load_url_static(url, client)
+
+    response = await client.get(url)
+    return [Document(page_content=response.text, metadata={"source": url})]
 
 
 async def load_url_js(url: str) -> list[Document]:
@@ -36,12 +99,12 @@ async def load_url_js(url: str) -> list[Document]:
     return docs or []
 
 
-async def load_url_auto(url: str, settings: Settings) -> list[Document]:
+async def load_url_auto(url: str, settings: Settings, client: httpx.AsyncClient | None = None) -> list[Document]:
     """
     Automatically choose between static and JS loading.
     Falls back to JS rendering if content is insufficient or looks like SPA.
     """
-    static_docs = await load_url_static(url)
+    static_docs = await load_url_static(url, client)
     baseline = static_docs[0].page_content.strip() if static_docs else ""
 
     if not settings.use_playwright_fallback:
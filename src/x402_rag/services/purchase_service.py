@@ -2,8 +2,9 @@
 
 import logging
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import String, any_, bindparam, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from x402_rag.core import RuntimeContext
 from x402_rag.db.schemas import ChunkPurchase
@@ -23,13 +24,16 @@ class PurchaseService:
         if not chunk_ids:
             return set()
 
-        async with AsyncSession(self.async_engine) as session:
-            stmt = select(ChunkPurchase.chunk_id).where(
-                ChunkPurchase.user_address == user_address,
-                ChunkPurchase.chunk_id.in_(chunk_ids),
-            )
-            result = await session.execute(stmt)
-            return {row[0] for row in result.fetchall()}
+        # One lookup served by the (user_address, chunk_id) primary key index. A plain read
+        # doesn't need an ORM session, so run it on a pooled connection directly. The ids are bound
+        # as a single array (= ANY($2)) rather than IN ($2, $3, ...), so the statement text is the
+        # same for any number of chunks and asyncpg reuses one prepared statement.
+        stmt = select(ChunkPurchase.chunk_id).where(
+            ChunkPurchase.user_address == user_address,
+            ChunkPurchase.chunk_id == any_(bindparam("chunk_ids", chunk_ids, type_=ARRAY(String))),
+        )
+        async with self.async_engine.connect() as conn:
+            return set(await conn.scalars(stmt))
 
     async def record_purchases(self, user_address: str, chunk_ids: list[str]) -> None:
         if not chunk_ids:
@@ -38,16 +42,14 @@ class PurchaseService:
         if not self.runtime_context.settings.x402.enabled:
             return
 
-        async with AsyncSession(self.async_engine) as session:
-            # Use insert with on_conflict_do_nothing to avoid duplicate key errors
-            for chunk_id in chunk_ids:
-                purchase = ChunkPurchase(
-                    user_address=user_address,
-                    chunk_id=chunk_id,
-                )
-                session.add(purchase)
-
-            await session.commit()
+        # One multi-row insert; chunks already recorded (e.g. by a concurrent request) are skipped
+        stmt = (
+            pg_insert(ChunkPurchase)
+            .values([{"user_address": user_address, "chunk_id": chunk_id} for chunk_id in chunk_ids])
+            .on_conflict_do_nothing(index_elements=["user_address", "chunk_id"])
+        )
+        async with self.async_engine.begin() as conn:
+            await conn.execute(stmt)
             logger.debug(f"Recorded {len(chunk_ids)} chunk purchases for user {user_address}")
 
     async def filter_unpaid_chunks(
@@ -64,10 +66,9 @@ class PurchaseService:
         # Get paid chunk IDs
         paid_ids = await self.get_paid_chunk_ids(user_address, chunk_ids)
 
-        # Split chunks into paid and unpaid
+        # Split chunks into paid and unpaid in a single pass
         unpaid_chunks = []
         paid_chunks = []
-
         for chunk, chunk_id in zip(chunks, chunk_ids, strict=True):
             if chunk_id in paid_ids:
                 paid_chunks.append(chunk)
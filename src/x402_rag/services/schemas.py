@@ -1,5 +1,5 @@
 from langchain_core.documents import Document as LCDocument
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class DocumentChunkMetadata(BaseModel):
@@ -25,6 +25,16 @@ class DocumentChunk(BaseModel):
             metadata=DocumentChunkMetadata.model_validate(doc.metadata),
         )
 
+    @staticmethod
+    def from_langchain_documents(docs: list[LCDocument]) -> list["DocumentChunk"]:
+        # Validating the whole list in one pydantic-core call is much cheaper than a model per document
+        return _DOCUMENT_CHUNKS_ADAPTER.validate_python(
+            [{"text": doc.page_content, "metadata": doc.metadata} for doc in docs]
+        )
+
+
+_DOCUMENT_CHUNKS_ADAPTER = TypeAdapter(list[DocumentChunk])
+
 
 class DocumentToIndex(BaseModel):
     """A document to be indexed with its price."""
@@ -60,6 +70,12 @@ class SearchRequest(BaseModel):
     filters: dict[str, str] | None = Field(default=None, description="Optional metadata filters")
 
 
+class SearchBatchRequest(BaseModel):
+    """Request to run several searches at once."""
+
+    queries: list[SearchRequest] = Field(min_length=1, description="Searches to run")
+
+
 class FetchChunksByRangeRequest(BaseModel):
     """Request to fetch a range of chunks for a specific document."""
 
@@ -76,10 +92,16 @@ class SearchResult(BaseModel):
 
     @staticmethod
     def from_langchain_documents(docs: list[LCDocument]) -> "SearchResult":
-        chunks = [DocumentChunk.from_langchain_document(doc) for doc in docs]
+        chunks = DocumentChunk.from_langchain_documents(docs)
         return SearchResult(chunks=chunks, total=len(chunks))
 
 
+class SearchBatchResult(BaseModel):
+    """Results from a batch of searches, in request order."""
+
+    results: list[SearchResult]
+
+
 class IndexedDocument(BaseModel):
     """An indexed document."""
 
@@ -103,5 +125,5 @@ class FetchChunksByRangeResult(BaseModel):
 
     @staticmethod
     def from_langchain_documents(doc_id: str, docs: list[LCDocument]) -> "FetchChunksByRangeResult":
-        chunks = [DocumentChunk.from_langchain_document(doc) for doc in docs]
+        chunks = DocumentChunk.from_langchain_documents(docs)
         return FetchChunksByRangeResult(doc_id=doc_id, chunks=chunks, total=len(chunks))
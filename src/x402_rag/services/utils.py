@@ -2,7 +2,7 @@
 
 import hashlib
 import re
-import uuid
+from functools import lru_cache
 
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
@@ -14,13 +14,15 @@ def sha256_hex(s: str) -> str:
     return hashlib.sha256(s.encode("utf-8")).hexdigest()
 
 
+@lru_cache(maxsize=65536)
 def stable_chunk_uuid(doc_id: str, chunk_idx: int) -> str:
     """
     Generate a deterministic UUID derived from (doc_id, chunk_idx).
     Uses SHA1 (hex[:32]) -> UUID, which is stable and compact.
     """
-    h = hashlib.sha1(f"{doc_id}:{chunk_idx}".encode()).hexdigest()[:32]
-    return str(uuid.UUID(h))
+    # Same string as str(uuid.UUID(h)), formatted directly instead of through a UUID object
+    h = hashlib.sha1(f"{doc_id}:{chunk_idx}".encode()).hexdigest()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:32]}"
 
 
 def build_doc_id(source: str) -> str:
@@ -28,27 +30,30 @@ def build_doc_id(source: str) -> str:
     return sha256_hex(source)
 
 
+# Mount points of common SPA frameworks (React, Next.js, Vue), matched against lowercased HTML
+SPA_ROOT_DIV_RE = re.compile(r'<div[^>]+id=["\'](?:root|__next|app)["\']')
+
+
 def looks_like_spa(html_text: str) -> bool:
     """
     Heuristic to detect if HTML looks like a Single Page App
     that needs JavaScript rendering.
     """
     h = (html_text or "").lower()
-    patterns = [
-        r'<div[^>]+id=["\']root["\']',
-        r'<div[^>]+id=["\']__next["\']',
-        r'<div[^>]+id=["\']app["\']',
-        r"data-reactroot",
-    ]
-    score = sum(bool(re.search(p, h)) for p in patterns)
-    many_scripts = h.count("<script") >= 8
-    return score >= 1 or many_scripts
+    # Any one signal is enough, so the plain substring checks run before the regex scan
+    return "data-reactroot" in h or h.count("<script") >= 8 or SPA_ROOT_DIV_RE.search(h) is not None
 
 
 def build_text_splitter(settings: Settings) -> RecursiveCharacterTextSplitter:
+    return _text_splitter(settings.chunk_size, settings.chunk_overlap)
+
+
+@lru_cache(maxsize=8)
+def _text_splitter(chunk_size: int, chunk_overlap: int) -> RecursiveCharacterTextSplitter:
+    # split_text keeps no state between calls, so services with the same chunking share one splitter
     return RecursiveCharacterTextSplitter(
-        chunk_size=settings.chunk_size,
-        chunk_overlap=settings.chunk_overlap,
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
         length_function=len,
         separators=["\n\n", "\n", " ", ""],
     )
@@ -1,10 +1,13 @@
 import asyncio
 import logging
 
+import httpx
+from langchain_core.documents import Document
+
 from x402_rag.core import RuntimeContext
 
 from .base import BaseIndexService
-from .loaders import load_url_auto
+from .loaders import create_web_client, load_url_auto
 from .schemas import IndexedDocument, IndexResult, WebPageToIndex
 from .utils import (
     build_text_splitter,
@@ -20,16 +23,36 @@ class WebIndexService(BaseIndexService):
             text_splitter=build_text_splitter(runtime_context.settings),
             settings=runtime_context.settings,
         )
+        # One client for the lifetime of the service, so loads reuse kept-alive connections
+        # instead of paying a TCP/TLS handshake per URL
+        self._http: httpx.AsyncClient | None = None
+
+    def _client(self) -> httpx.AsyncClient:
+        if self._http is None:
+            self._http = create_web_client()
+        return self._http
+
+    async def close(self) -> None:
+        """Close the pooled connections used to load web pages."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     async def index_web_pages(self, pages_to_index: list[WebPageToIndex]) -> IndexResult:
         """
         Index web pages from URLs.
         """
+        # A URL listed more than once is indexed once, with its last price (see DocIndexService.index_docs)
+        pages_to_index = list({page.url: page for page in pages_to_index}.values())
+
         urls = [page.url for page in pages_to_index]
-        batches = await asyncio.gather(*[load_url_auto(u, self.settings) for u in urls])
+        client = self._client()
+        batches = await asyncio.gather(*[load_url_auto(u, self.settings, client) for u in urls])
         logger.debug(f"Loaded {len(batches)}/{len(urls)} web pages")
 
         indexed_documents: list[IndexedDocument] = []
+        all_chunks: list[Document] = []
+        all_chunk_ids: list[str] = []
         for page_to_index, docs in zip(pages_to_index, batches, strict=True):
             url = page_to_index.url
             page_price_usd = page_to_index.price_usd
@@ -38,22 +61,33 @@ class WebIndexService(BaseIndexService):
                 logger.warning(f"No documents found for URL {url}")
                 continue
 
-            full_text = "\n\n".join(
-                [(d.page_content or "").strip() for d in docs if (d.page_content or "").strip()]
-            )
+            # Strip each document once and drop the empty ones
+            full_text = "\n\n".join(filter(None, [(d.page_content or "").strip() for d in docs]))
             if not full_text:
                 logger.warning(f"No text found for URL {url}")
                 continue
 
-            doc = await self.index_document(
+            # Splitting a large document takes a while; a worker thread keeps the event loop responsive meanwhile
+            built = await asyncio.to_thread(
+                self.build_document_chunks,
                 source=url,
                 content=full_text,
                 price_usd=page_price_usd,
                 doc_type="web",
             )
+            if built is None:
+                continue
+
+            doc, chunks, chunk_ids = built
             indexed_documents.append(doc)
+            all_chunks.extend(chunks)
+            all_chunk_ids.extend(chunk_ids)
+
+            logger.debug(f"Prepared {doc.chunks_count} chunks for URL {url} with price ${page_price_usd}")
 
-            logger.debug(f"Indexed {doc.chunks_count} chunks for URL {url} with price ${page_price_usd}")
+        # Chunks of all pages are added together, so the embedding requests and inserts are batched across pages
+        await self.add_document_chunks(all_chunks, all_chunk_ids)
+        logger.debug(f"Indexed {len(all_chunks)} chunks from {len(indexed_documents)} web pages")
 
         return IndexResult(
             indexed_documents=indexed_documents,